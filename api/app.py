@@ -20,45 +20,123 @@ ARCHITECTURE:
 │  │   /health   │  │  /api/v1/   │  │   Middleware            │ │
 │  │   /status   │  │  createTask │  │   - CORS                │ │
 │  │   /ready    │  │  getResult  │  │   - Exception Handler   │ │
-│  │   /live     │  │  solve      │  │   - Request Logging     │ │
-│  └─────────────┘  │  balance    │  └─────────────────────────┘ │
+│  │   /live     │  │  solve      │  │   - GZip (>= 1KB)       │ │
+│  └─────────────┘  │  balance    │  │   - Request Logging     │ │
+│                   │             │  └─────────────────────────┘ │
 │                   └─────────────┘                               │
 │                                                                  │
 │  ┌──────────────────────────────────────────────────────────┐  │
 │  │                    Lifespan Manager                       │  │
-│  │  STARTUP:  Load YOLO Model → Init Browser Pool           │  │
-│  │  SHUTDOWN: Close Browsers → Cleanup Resources            │  │
+│  │  STARTUP:  Open DB → Load YOLO Model → Init Browser Pool │  │
+│  │  SHUTDOWN: Close Browsers → Cleanup Resources → Close DB │  │
 │  └──────────────────────────────────────────────────────────┘  │
 └─────────────────────────────────────────────────────────────────┘
 """
 
 import logging
-import time
 from typing import Optional, Callable, Any
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 
 from ..core.config import get_config
+from ..utils.http import get_http_session, close_http_session
+from database import init_db, close_db, start_usage_writer, stop_usage_writer
+from .middleware.auth import preload_owner_keys, start_debit_flusher, stop_debit_flusher
+from .middleware.prefix import CompatPrefixMiddleware
+from .middleware.timing import RequestLoggingMiddleware
 
 logger = logging.getLogger(__name__)
 
+API_PREFIX = "/api/v1"
+
+# HTTP status -> 2captcha errorId (built once, not per exception)
+_ERROR_ID_MAP = {
+    400: 15,  # BAD_PARAMETERS
+    401: 1,   # KEY_DOES_NOT_EXIST
+    404: 16,  # NOT_FOUND
+    500: 99,  # INTERNAL_ERROR
+}
+_DEFAULT_ERROR_ID = 99
+
+# Fixed error bodies
+_VALIDATION_ERROR_TEMPLATE = {
+    "errorId": 15,
+    "errorMessage": "Bad request parameters",
+}
+_INTERNAL_ERROR_CONTENT = {
+    "errorId": 99,
+    "errorMessage": "Internal server error"
+}
+
+
+@asynccontextmanager
+async def _framework_lifespan(app: FastAPI):
+    """
+    Startup/shutdown work the API itself depends on.
+    
+    Always runs, regardless of which lifespan the caller passes in:
+    - Opens the SQLite connection once (no handshake on first request)
+    - Starts the batched usage-log writer (flushed on shutdown)
+    - Starts the coalesced balance-debit flusher (flushed on shutdown)
+    - Opens the shared outbound HTTP session (app.state.http)
+    - Starts the /createTask worker pool
+    - Preloads owner keys into the auth key cache
+    """
+    from .routes.tasks import start_task_workers, stop_task_workers
+    
+    logger.info("Opening database connection...")
+    await init_db()
+    start_usage_writer()
+    start_debit_flusher()
+    
+    try:
+        count = await preload_owner_keys()
+        logger.info("Preloaded %d owner key(s) into auth cache", count)
+    except Exception as e:
+        logger.warning("Could not preload owner keys: %s", e)
+    
+    app.state.http = await get_http_session()
+    start_task_workers()
+    
+    try:
+        yield
+    finally:
+        await stop_task_workers()
+        await close_http_session()
+        await stop_debit_flusher()
+        await stop_usage_writer()
+        await close_db()
+        logger.info("Database connection closed")
+
 
 def create_app(lifespan: Optional[Callable] = None) -> FastAPI:
     """
     Create and configure the FastAPI application.
     
     Args:
-        lifespan: Async context manager for startup/shutdown events
+        lifespan: Async context manager for startup/shutdown events.
+            Runs nested inside the framework lifespan, so the database
+            is already open when it starts and still open when it exits.
     
     Returns:
         Configured FastAPI app
     """
     config = get_config()
     
+    @asynccontextmanager
+    async def merged_lifespan(app: FastAPI):
+        async with _framework_lifespan(app):
+            if lifespan is not None:
+                async with lifespan(app):
+                    yield
+            else:
+                yield
+    
     # Create FastAPI app with lifespan
     app = FastAPI(
         title="Unified reCAPTCHA Solver",
@@ -66,42 +144,39 @@ def create_app(lifespan: Optional[Callable] = None) -> FastAPI:
         version="2.0.0",
         docs_url="/docs" if config.server.debug else None,
         redoc_url="/redoc" if config.server.debug else None,
-        lifespan=lifespan,
+        lifespan=merged_lifespan,
+        default_response_class=ORJSONResponse,  # orjson: ~3-5x faster than stdlib json
     )
     
     # ==========================================================================
-    # CORS Middleware - Allow all origins for API access
+    # CORS Middleware - origins from config.server.cors_origins
     # ==========================================================================
+    # Wildcard + credentials forces Starlette to echo the request Origin and
+    # rebuild headers per request. The API authenticates via clientKey in the
+    # body (no cookies), so the wildcard case runs without credentials and
+    # Starlette serves its precomputed static headers. An explicit origin
+    # list keeps credentials enabled.
+    cors_origins = config.server.cors_origins
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
+        allow_origins=cors_origins,
+        allow_credentials="*" not in cors_origins,
         allow_methods=["*"],
         allow_headers=["*"],
     )
     
     # ==========================================================================
-    # Request Logging Middleware
+    # GZip Middleware - compress JSON responses >= 1KB
+    # Starlette >= 0.46 leaves text/event-stream alone, so /getTaskResult/stream
+    # events are flushed one by one instead of buffered until the stream ends.
+    # ==========================================================================
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+    
+    # ==========================================================================
+    # Request Logging Middleware (pure ASGI - no BaseHTTPMiddleware overhead)
+    # Added after GZip so it wraps it: timing includes the compressed send.
     # ==========================================================================
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        """Log all incoming requests with timing"""
-        start_time = time.time()
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Calculate duration
-        duration = time.time() - start_time
-        
-        # Log (skip health checks for cleaner logs)
-        if not request.url.path.startswith("/health"):
-            logger.info(
-                f"{request.method} {request.url.path} - "
-                f"{response.status_code} - {duration:.3f}s"
-            )
-        
-        return response
+    app.add_middleware(RequestLoggingMiddleware)
     
     # ==========================================================================
     # Exception Handlers
@@ -109,28 +184,17 @@ def create_app(lifespan: Optional[Callable] = None) -> FastAPI:
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
         """Handle Pydantic validation errors"""
-        return JSONResponse(
-            status_code=400,
-            content={
-                "errorId": 15,
-                "errorMessage": "Bad request parameters",
-                "details": exc.errors()
-            }
-        )
+        content = _VALIDATION_ERROR_TEMPLATE.copy()
+        content["details"] = exc.errors()
+        return ORJSONResponse(status_code=400, content=content)
     
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
         """Handle HTTP exceptions"""
-        error_map = {
-            400: 15,  # BAD_PARAMETERS
-            401: 1,   # KEY_DOES_NOT_EXIST
-            404: 16,  # NOT_FOUND
-            500: 99,  # INTERNAL_ERROR
-        }
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
-                "errorId": error_map.get(exc.status_code, 99),
+                "errorId": _ERROR_ID_MAP.get(exc.status_code, _DEFAULT_ERROR_ID),
                 "errorMessage": exc.detail
             }
         )
@@ -138,14 +202,8 @@ def create_app(lifespan: Optional[Callable] = None) -> FastAPI:
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle uncaught exceptions"""
-        logger.error(f"Unhandled exception: {exc}", exc_info=True)
-        return JSONResponse(
-            status_code=500,
-            content={
-                "errorId": 99,
-                "errorMessage": "Internal server error"
-            }
-        )
+        logger.error("Unhandled exception: %s", exc, exc_info=True)
+        return ORJSONResponse(status_code=500, content=_INTERNAL_ERROR_CONTENT)
     
     # ==========================================================================
     # Register Routers
@@ -157,14 +215,18 @@ def create_app(lifespan: Optional[Callable] = None) -> FastAPI:
     # Health routes at root level
     app.include_router(health_router, tags=["Health"])
     
-    # API routes with /api/v1 prefix
-    app.include_router(tasks_router, prefix="/api/v1", tags=["Tasks"])
-    app.include_router(balance_router, prefix="/api/v1", tags=["Balance"])
+    # API routes with /api/v1 prefix (mounted ONCE)
+    app.include_router(tasks_router, prefix=API_PREFIX, tags=["Tasks"])
+    app.include_router(balance_router, prefix=API_PREFIX, tags=["Balance"])
     
-    # Also mount at root for 2captcha compatibility
-    app.include_router(tasks_router, tags=["Tasks (Root)"])
-    app.include_router(balance_router, tags=["Balance (Root)"])
+    # Root aliases for 2captcha compatibility: rewritten to /api/v1 at the
+    # ASGI layer instead of duplicating every route in the router table
+    app.add_middleware(
+        CompatPrefixMiddleware,
+        prefix=API_PREFIX,
+        paths=[route.path for route in (*tasks_router.routes, *balance_router.routes)],
+    )
     
-    logger.info(f"FastAPI app created, debug={config.server.debug}")
+    logger.info("FastAPI app created, debug=%s", config.server.debug)
     
     return app
@@ -3,5 +3,14 @@ API Middleware Module
 """
 
 from .auth import validate_api_key, get_balance, deduct_balance, is_owner_key
+from .prefix import CompatPrefixMiddleware
+from .timing import RequestLoggingMiddleware
 
-__all__ = ['validate_api_key', 'get_balance', 'deduct_balance', 'is_owner_key']
+__all__ = [
+    'validate_api_key',
+    'get_balance',
+    'deduct_balance',
+    'is_owner_key',
+    'CompatPrefixMiddleware',
+    'RequestLoggingMiddleware',
+]
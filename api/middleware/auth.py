@@ -12,24 +12,155 @@ This module provides async functions for:
 
 All operations use the database module with aiosqlite for
 concurrent-safe async database access.
+
+KEY CACHE:
+----------
+Key lookups go through a small in-process TTL/LRU cache so repeated
+validation of the same key is a dict lookup instead of a SQLite
+round-trip. Every write path pops the key from the cache.
+
+BALANCE RESPONSE CACHE:
+-----------------------
+/getBalance is polled by clients. Its serialized response is cached per
+key for a short TTL (config.cache.balance_ttl) and popped together with
+the key cache on every write.
+
+COALESCED DEBITS:
+-----------------
+Solved tasks do not write their charge immediately. deduct_balance()
+adds it to a per-key pending total, and a background flusher applies
+all pending totals in one transaction every DEBIT_FLUSH_INTERVAL
+seconds (and once more on shutdown).
 """
 
+import asyncio
 import logging
+import time
 import uuid
-from typing import Tuple, Optional, Dict, Any
+from collections import OrderedDict, defaultdict
+from typing import Tuple, Optional, Dict, Any, List
 from datetime import datetime, timedelta
 
+from ...core.config import get_config
 from database import (
     get_api_key,
-    update_api_key_balance,
+    deduct_api_key_balance,
+    credit_api_key_balance,
+    bulk_deduct_api_key_balances,
     create_api_key as db_create_api_key,
     get_all_api_keys,
-    log_usage,
+    queue_usage,
 )
 
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# KEY CACHE - TTL + LRU bounded
+# =============================================================================
+
+_cache_config = get_config().cache
+
+KEY_CACHE_TTL = _cache_config.key_ttl
+KEY_CACHE_MAX_SIZE = _cache_config.key_max_size
+BALANCE_CACHE_TTL = _cache_config.balance_ttl
+
+# key -> (expires_at monotonic, key_data)
+_KEY_CACHE: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# key -> (expires_at monotonic, serialized /getBalance response)
+_BAL_CACHE: Dict[str, Tuple[float, bytes]] = {}
+
+# key -> invalidation count. A fill whose read started before an
+# invalidation would write back the pre-debit / pre-top-up row, so it is
+# dropped when the count moved during the read.
+_KEY_GENERATION: Dict[str, int] = {}
+
+
+def _parse_expiry(expires_at: Optional[str]) -> Optional[float]:
+    """
+    Parse an ISO expiry string to a UNIX timestamp, once per cache fill.
+    
+    Invalid formats return None (expiry check skipped), matching the
+    previous parse-on-every-request behavior.
+    """
+    if not expires_at:
+        return None
+    try:
+        return datetime.fromisoformat(expires_at).timestamp()
+    except (ValueError, TypeError):
+        return None
+
+
+async def _cached_get_api_key(api_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Get key data, served from the in-process cache when fresh.
+    
+    Misses (including unknown keys) are not cached, so a newly
+    created key is visible immediately.
+    """
+    entry = _KEY_CACHE.get(api_key)
+    if entry is not None:
+        expires, key_data = entry
+        if expires > time.monotonic():
+            _KEY_CACHE.move_to_end(api_key)
+            return key_data
+        del _KEY_CACHE[api_key]
+    
+    generation = _KEY_GENERATION.get(api_key, 0)
+    key_data = await get_api_key(api_key)
+    if key_data is not None:
+        key_data['_expires_ts'] = _parse_expiry(key_data.get('expires_at'))
+        if _KEY_GENERATION.get(api_key, 0) == generation:
+            _KEY_CACHE[api_key] = (time.monotonic() + KEY_CACHE_TTL, key_data)
+            if len(_KEY_CACHE) > KEY_CACHE_MAX_SIZE:
+                _KEY_CACHE.popitem(last=False)
+    
+    return key_data
+
+
+def invalidate_cached_key(api_key: str) -> None:
+    """Drop a key from the caches after it has been modified."""
+    _KEY_GENERATION[api_key] = _KEY_GENERATION.get(api_key, 0) + 1
+    _KEY_CACHE.pop(api_key, None)
+    _BAL_CACHE.pop(api_key, None)
+
+
+def get_cached_balance_response(api_key: str) -> Optional[bytes]:
+    """Return the cached /getBalance response body if still fresh."""
+    entry = _BAL_CACHE.get(api_key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def cache_balance_response(api_key: str, body: bytes) -> None:
+    """Store a serialized /getBalance response body for BALANCE_CACHE_TTL."""
+    if len(_BAL_CACHE) >= KEY_CACHE_MAX_SIZE:
+        now = time.monotonic()
+        for key in [k for k, (expires, _) in _BAL_CACHE.items() if expires <= now]:
+            del _BAL_CACHE[key]
+        if len(_BAL_CACHE) >= KEY_CACHE_MAX_SIZE:
+            _BAL_CACHE.clear()
+    _BAL_CACHE[api_key] = (time.monotonic() + BALANCE_CACHE_TTL, body)
+
+
+async def preload_owner_keys() -> int:
+    """
+    Warm the key cache with all owner keys (called at startup).
+    
+    Returns:
+        Number of keys preloaded
+    """
+    keys = await get_all_api_keys()
+    count = 0
+    for key_data in keys:
+        if key_data['is_owner']:
+            await _cached_get_api_key(key_data['key'])
+            count += 1
+    return count
+
+
 async def validate_api_key(api_key: str) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
     """
     Validate an API key and return its data (async).
@@ -49,19 +180,15 @@ async def validate_api_key(api_key: str) -> Tuple[bool, Optional[str], Optional[
     if not api_key:
         return False, "API key is required", None
     
-    key_data = await get_api_key(api_key)
+    key_data = await _cached_get_api_key(api_key)
     
     if not key_data:
         return False, "Invalid API key", None
     
-    # Check expiry
-    if key_data.get('expires_at'):
-        try:
-            expires = datetime.fromisoformat(key_data['expires_at'])
-            if datetime.now() > expires:
-                return False, "API key has expired", None
-        except (ValueError, TypeError):
-            pass  # Invalid date format, ignore expiry check
+    # Check expiry (pre-parsed when the key was cached)
+    expires_ts = key_data['_expires_ts']
+    if expires_ts is not None and time.time() > expires_ts:
+        return False, "API key has expired", None
     
     # Check balance
     if key_data.get('balance', 0) <= 0:
@@ -72,52 +199,146 @@ async def validate_api_key(api_key: str) -> Tuple[bool, Optional[str], Optional[
 
 async def get_balance(api_key: str) -> float:
     """Get the balance for an API key (async)"""
-    key_data = await get_api_key(api_key)
+    key_data = await _cached_get_api_key(api_key)
     if key_data:
         return key_data.get('balance', 0.0)
     return 0.0
 
 
-async def deduct_balance(api_key: str, amount: float, action: str = "solve") -> float:
+# =============================================================================
+# COALESCED DEBITS
+# =============================================================================
+
+DEBIT_FLUSH_INTERVAL = 0.1  # seconds
+
+# key -> total amount awaiting the next flush
+_pending_debits: Dict[str, float] = defaultdict(float)
+# (key, amount, action) per deduct, for the usage log written after the flush
+_pending_events: List[Tuple[str, float, str]] = []
+
+_debit_flusher_task: Optional[asyncio.Task] = None
+
+
+async def _flush_debits():
+    """Apply all pending debits in one transaction."""
+    global _pending_debits, _pending_events
+    
+    if not _pending_debits:
+        return
+    
+    # Swap the buffers first: deducts arriving during the write go to the next flush
+    debits, events = _pending_debits, _pending_events
+    _pending_debits, _pending_events = defaultdict(float), []
+    
+    try:
+        new_balances = await bulk_deduct_api_key_balances(debits)
+    except Exception as e:
+        logger.error("Failed to flush %d pending debit(s), will retry: %s", len(debits), e)
+        for key, amount in debits.items():
+            _pending_debits[key] += amount
+        _pending_events[:0] = events
+        return
+    
+    for key in debits:
+        invalidate_cached_key(key)
+    
+    for key, amount, action in events:
+        if key not in new_balances:
+            continue
+        await queue_usage(
+            api_key=key,
+            action=action,
+            amount=amount,
+            success=True,
+            metadata={"new_balance": new_balances[key]}
+        )
+    
+    logger.debug("Flushed %d debit(s) across %d key(s)", len(events), len(debits))
+
+
+async def _debit_flusher():
+    """Flush pending debits every DEBIT_FLUSH_INTERVAL seconds until cancelled."""
+    while True:
+        await asyncio.sleep(DEBIT_FLUSH_INTERVAL)
+        await _flush_debits()
+
+
+def start_debit_flusher():
+    """Start the background debit flusher (call once at startup)."""
+    global _debit_flusher_task
+    
+    if _debit_flusher_task is not None:
+        return
+    
+    _debit_flusher_task = asyncio.create_task(_debit_flusher())
+    logger.info("Debit flusher started")
+
+
+async def stop_debit_flusher():
+    """Stop the flusher and apply whatever is still pending (call before stop_usage_writer)."""
+    global _debit_flusher_task
+    
+    if _debit_flusher_task is None:
+        return
+    
+    _debit_flusher_task.cancel()
+    try:
+        await _debit_flusher_task
+    except asyncio.CancelledError:
+        pass
+    _debit_flusher_task = None
+    
+    await _flush_debits()
+    logger.info("Debit flusher stopped")
+
+
+async def deduct_balance(api_key: str, amount: float, action: str = "solve") -> Optional[float]:
     """
     Deduct balance from an API key (async).
     
+    With the debit flusher running the charge is queued and applied
+    on the next flush. Without it (e.g. scripts outside the server)
+    it is written immediately.
+    
     Args:
         api_key: The API key
         amount: Amount to deduct
         action: Action description for logging
     
     Returns:
-        New balance
+        New balance when written immediately, None when queued
     """
-    key_data = await get_api_key(api_key)
-    
-    if not key_data:
-        return 0.0
+    if _debit_flusher_task is not None:
+        _pending_debits[api_key] += amount
+        _pending_events.append((api_key, amount, action))
+        return None
     
-    current_balance = key_data.get('balance', 0.0)
-    new_balance = max(0, current_balance - amount)
+    # Single atomic UPDATE ... RETURNING (no read-modify-write race)
+    new_balance = await deduct_api_key_balance(api_key, amount)
+    invalidate_cached_key(api_key)
     
-    # Update balance in database
-    success = await update_api_key_balance(api_key, new_balance)
+    if new_balance is None:
+        return 0.0
     
-    if success:
-        # Log the usage
-        await log_usage(
-            api_key=api_key,
-            action=action,
-            amount=amount,
-            success=True,
-            metadata={"previous_balance": current_balance}
-        )
-        logger.debug(f"Deducted {amount} from {api_key[:20]}..., new balance: {new_balance}")
+    # Log the usage
+    await queue_usage(
+        api_key=api_key,
+        action=action,
+        amount=amount,
+        success=True,
+        metadata={"new_balance": new_balance}
+    )
+    logger.debug("Deducted %s from %s..., new balance: %s", amount, api_key[:20], new_balance)
     
     return new_balance
 
 
 async def add_balance(api_key: str, amount: float) -> float:
     """
-    Add balance to an API key (async).
+    Add balance to an API key, creating the key if it does not exist (async).
+    
+    The credit is a single atomic UPDATE, so it never overwrites
+    concurrent debits or works from a stale cached balance.
     
     Args:
         api_key: The API key
@@ -126,42 +347,48 @@ async def add_balance(api_key: str, amount: float) -> float:
     Returns:
         New balance
     """
-    key_data = await get_api_key(api_key)
+    new_balance = await credit_api_key_balance(api_key, amount)
+    invalidate_cached_key(api_key)
     
-    if not key_data:
+    if new_balance is None:
         # Create new key with the specified balance
         new_key = await db_create_api_key(
             key=api_key,
             balance=amount,
             is_owner=False
         )
+        invalidate_cached_key(api_key)
         if new_key:
             return amount
         return 0.0
     
-    current_balance = key_data.get('balance', 0.0)
-    new_balance = current_balance + amount
-    
-    success = await update_api_key_balance(api_key, new_balance)
+    # Log the balance addition
+    await queue_usage(
+        api_key=api_key,
+        action="add_balance",
+        amount=amount,
+        success=True,
+        metadata={"previous_balance": new_balance - amount}
+    )
     
-    if success:
-        # Log the balance addition
-        await log_usage(
-            api_key=api_key,
-            action="add_balance",
-            amount=amount,
-            success=True,
-            metadata={"previous_balance": current_balance}
-        )
+    return new_balance
+
+
+async def key_exists(api_key: str) -> bool:
+    """
+    Check that an API key exists (async).
     
-    return new_balance if success else current_balance
+    Existence only - no expiry or balance checks, unlike
+    validate_api_key(). Served from the key cache when warm.
+    """
+    return await _cached_get_api_key(api_key) is not None
 
 
 async def is_owner_key(api_key: str) -> bool:
     """Check if an API key has owner privileges (async)"""
-    key_data = await get_api_key(api_key)
+    key_data = await _cached_get_api_key(api_key)
     if key_data:
-        return bool(key_data.get('is_owner', False))
+        return key_data['is_owner']
     return False
 
 
@@ -193,9 +420,10 @@ async def create_api_key(
         is_owner=is_owner,
         expires_at=expires_at
     )
+    invalidate_cached_key(new_key)
     
     if success:
-        logger.info(f"Created new API key: {new_key[:20]}... (owner: {is_owner})")
+        logger.info("Created new API key: %s... (owner: %s)", new_key[:20], is_owner)
         return new_key
     
     return ""
@@ -235,7 +463,7 @@ async def get_key_stats(api_key: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with key statistics or None if not found
     """
-    key_data = await get_api_key(api_key)
+    key_data = await _cached_get_api_key(api_key)
     
     if not key_data:
         return None
@@ -243,7 +471,7 @@ async def get_key_stats(api_key: str) -> Optional[Dict[str, Any]]:
     return {
         "key": api_key,
         "balance": key_data['balance'],
-        "is_owner": bool(key_data['is_owner']),
+        "is_owner": key_data['is_owner'],
         "created_at": key_data['created_at'],
         "expires_at": key_data['expires_at'],
         "last_used_at": key_data.get('last_used_at'),
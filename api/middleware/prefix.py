@@ -0,0 +1,42 @@
+"""
+Compatibility Prefix Middleware
+===============================
+
+Serves the /api/v1 routers at the root as well, without mounting them twice.
+
+2captcha clients call /createTask, /getTaskResult, ... at the root, while our
+routers live under /api/v1. Mounting every router twice doubles the route
+table FastAPI scans on each request. Instead this pure ASGI middleware
+rewrites known root paths to their /api/v1 equivalent before routing.
+"""
+
+from typing import Iterable
+
+
+class CompatPrefixMiddleware:
+    """
+    Rewrite `/<endpoint>` to `<prefix>/<endpoint>` for a fixed set of endpoints.
+
+    Usage:
+        app.add_middleware(
+            CompatPrefixMiddleware,
+            prefix="/api/v1",
+            paths=["/createTask", "/getBalance"],
+        )
+    """
+
+    def __init__(self, app, prefix: str, paths: Iterable[str]):
+        self.app = app
+        self.prefix = prefix
+        self.raw_prefix = prefix.encode()
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            scope = dict(scope)
+            scope["path"] = self.prefix + scope["path"]
+            raw_path = scope.get("raw_path")
+            if raw_path is not None:
+                scope["raw_path"] = self.raw_prefix + raw_path
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,66 @@
+"""
+Request Timing Middleware
+=========================
+
+Pure ASGI request logger.
+
+WHY NOT @app.middleware("http"):
+--------------------------------
+The decorator form is built on BaseHTTPMiddleware, which wraps every
+request in an extra task and materializes Request/Response objects
+just so we can read the method, path and status code.
+
+This middleware works on the raw ASGI scope/send instead:
+- No per-request task creation
+- No Request/Response allocation
+- Status code captured from the "http.response.start" message
+"""
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Health checks are polled constantly - keep them out of the logs.
+# Compared against the raw (bytes) path so no str decoding is needed.
+_HEALTH_PREFIX = b"/health"
+
+
+class RequestLoggingMiddleware:
+    """
+    Log method, path, status code and duration for every HTTP request.
+
+    Usage:
+        app.add_middleware(RequestLoggingMiddleware)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        raw_path = scope.get("raw_path") or scope["path"].encode()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if not raw_path.startswith(_HEALTH_PREFIX):
+                logger.info(
+                    "%s %s - %d - %.3fs",
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    time.perf_counter() - start_time,
+                )
@@ -2,8 +2,8 @@
 API Routes Module
 """
 
-from .tasks import tasks_bp
-from .balance import balance_bp
-from .health import health_bp
+from .tasks import router as tasks_router
+from .balance import router as balance_router
+from .health import router as health_router
 
-__all__ = ['tasks_bp', 'balance_bp', 'health_bp']
+__all__ = ['tasks_router', 'balance_router', 'health_router']
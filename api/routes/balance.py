@@ -3,17 +3,31 @@ Balance Routes - FastAPI
 ========================
 
 Handles /getBalance, /addBalance endpoints.
+
+FAST BODY PARSING:
+------------------
+These bodies are one to three fields, so the routes read the raw body,
+parse it with orjson and check the fields by hand instead of building a
+Pydantic model per request. The Pydantic models are kept as the request
+schema for the OpenAPI docs.
 """
 
+import asyncio
 import logging
 from typing import Optional
+
+import orjson
 from pydantic import BaseModel
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
+from .common import openapi_body, json_response, bad_request
 from ..middleware.auth import (
     validate_api_key, 
     add_balance as add_key_balance,
+    key_exists,
+    get_cached_balance_response,
+    cache_balance_response,
 )
 
 logger = logging.getLogger(__name__)
@@ -37,12 +51,17 @@ class AddBalanceRequest(BaseModel):
     amount: float
 
 
+# Static error bodies, serialized once at import
+_ERR_NO_PRIVILEGES = orjson.dumps({"errorId": 2, "errorMessage": "Insufficient privileges"})
+_ERR_TARGET_NOT_FOUND = orjson.dumps({"errorId": 1, "errorMessage": "Target key not found"})
+
+
 # =============================================================================
 # ROUTES
 # =============================================================================
 
-@router.post("/getBalance")
-async def get_balance_route(request: GetBalanceRequest):
+@router.post("/getBalance", openapi_extra=openapi_body(GetBalanceRequest))
+async def get_balance_route(request: Request):
     """
     Get account balance.
     
@@ -62,7 +81,20 @@ async def get_balance_route(request: GetBalanceRequest):
     ```
     """
     try:
-        key_valid, key_error, key_data = await validate_api_key(request.clientKey)
+        data = orjson.loads(await request.body())
+        client_key = data["clientKey"]
+        if not isinstance(client_key, str):
+            raise TypeError("clientKey must be a string")
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        return bad_request()
+    
+    try:
+        # Short-TTL response cache: collapses client polling bursts
+        cached = get_cached_balance_response(client_key)
+        if cached is not None:
+            return json_response(cached)
+        
+        key_valid, key_error, key_data = await validate_api_key(client_key)
         if not key_valid:
             return {
                 "errorId": 1,
@@ -72,21 +104,24 @@ async def get_balance_route(request: GetBalanceRequest):
         # Get balance from key_data (no extra DB call!)
         balance = key_data.get("balance", 0.0) if key_data else 0.0
         
-        return {
+        body = orjson.dumps({
             "errorId": 0,
             "balance": balance
-        }
+        })
+        cache_balance_response(client_key, body)
+        
+        return json_response(body)
         
     except Exception as e:
-        logger.error(f"Error getting balance: {e}")
+        logger.error("Error getting balance: %s", e)
         return {
             "errorId": 99,
             "errorMessage": str(e)
         }
 
 
-@router.post("/addBalance")
-async def add_balance(request: AddBalanceRequest):
+@router.post("/addBalance", openapi_extra=openapi_body(AddBalanceRequest))
+async def add_balance(request: Request):
     """
     Add balance to an account (admin only).
     
@@ -108,8 +143,22 @@ async def add_balance(request: AddBalanceRequest):
     ```
     """
     try:
-        # Validate admin key and get key_data
-        key_valid, key_error, key_data = await validate_api_key(request.clientKey)
+        data = orjson.loads(await request.body())
+        client_key = data["clientKey"]
+        target_key = data["targetKey"]
+        if not (isinstance(client_key, str) and isinstance(target_key, str)):
+            raise TypeError("clientKey and targetKey must be strings")
+        amount = float(data["amount"])
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        return bad_request()
+    
+    try:
+        # Validate admin key and look up target key concurrently (independent lookups)
+        (key_valid, key_error, key_data), target_exists = await asyncio.gather(
+            validate_api_key(client_key),
+            key_exists(target_key),
+        )
+        
         if not key_valid:
             return {
                 "errorId": 1,
@@ -118,21 +167,13 @@ async def add_balance(request: AddBalanceRequest):
         
         # Check if admin from key_data (no extra DB call!)
         if not (key_data and key_data.get("is_owner", False)):
-            return {
-                "errorId": 2,
-                "errorMessage": "Insufficient privileges"
-            }
+            return json_response(_ERR_NO_PRIVILEGES)
         
-        # Validate target key exists
-        target_valid, _, _ = await validate_api_key(request.targetKey)
-        if not target_valid:
-            return {
-                "errorId": 1,
-                "errorMessage": "Target key not found"
-            }
+        # Target key must exist (existence only: expired or empty keys can be topped up)
+        if not target_exists:
+            return json_response(_ERR_TARGET_NOT_FOUND)
         
-        # Add balance
-        new_balance = await add_key_balance(request.targetKey, request.amount)
+        new_balance = await add_key_balance(target_key, amount)
         
         return {
             "errorId": 0,
@@ -140,7 +181,7 @@ async def add_balance(request: AddBalanceRequest):
         }
         
     except Exception as e:
-        logger.error(f"Error adding balance: {e}")
+        logger.error("Error adding balance: %s", e)
         return {
             "errorId": 99,
             "errorMessage": str(e)
@@ -0,0 +1,33 @@
+"""
+Shared Route Helpers
+====================
+
+Helpers for routes that parse their request body by hand (orjson /
+msgspec) instead of through a Pydantic parameter.
+"""
+
+import orjson
+from fastapi import Response
+
+# Same shape as the app's RequestValidationError handler
+ERR_BAD_REQUEST = orjson.dumps({"errorId": 15, "errorMessage": "Bad request parameters"})
+
+
+def openapi_body(model) -> dict:
+    """OpenAPI requestBody for a route that parses its body by hand."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
+def json_response(body: bytes, status_code: int = 200) -> Response:
+    """Wrap pre-serialized JSON bytes in a response."""
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def bad_request() -> Response:
+    """400 response for a body that failed to parse or validate."""
+    return json_response(ERR_BAD_REQUEST, status_code=400)
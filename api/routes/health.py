@@ -3,10 +3,20 @@ Health Check Routes - FastAPI
 =============================
 
 Provides health, status, and readiness endpoints.
+
+PROBE RESPONSES:
+----------------
+/health and /live are constant, so their bodies are serialized once at
+import and served with an ETag and a short Cache-Control max-age. A
+probe that sends If-None-Match gets an empty 304. Both also answer
+HEAD. /ready is dynamic and never cached.
 """
 
+import hashlib
 import logging
-from fastapi import APIRouter
+
+import orjson
+from fastapi import APIRouter, Request, Response
 
 from ...core.task_manager import get_task_manager
 from ...core.browser_pool import get_browser_pool
@@ -16,15 +26,37 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_PROBE_CACHE_CONTROL = "public, max-age=5"
+
+
+def _probe(body: dict):
+    """Serialize a constant probe body once; returns (body bytes, headers)."""
+    data = orjson.dumps(body)
+    etag = '"%s"' % hashlib.sha1(data).hexdigest()[:16]
+    return data, {"Cache-Control": _PROBE_CACHE_CONTROL, "ETag": etag}
+
+
+_HEALTH_BODY, _HEALTH_HEADERS = _probe({
+    "status": "healthy",
+    "service": "unified-recaptcha-solver",
+    "version": "2.0.0"
+})
+_LIVE_BODY, _LIVE_HEADERS = _probe({"alive": True})
+_READY_BODY = orjson.dumps({"ready": True})
+
+
+def _probe_response(request: Request, body: bytes, headers: dict) -> Response:
+    """200 with the cached body, or 304 if the client already has it."""
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.get("/health")
-async def health_check():
+@router.head("/health", include_in_schema=False)
+async def health_check(request: Request):
     """Basic health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "unified-recaptcha-solver",
-        "version": "2.0.0"
-    }
+    return _probe_response(request, _HEALTH_BODY, _HEALTH_HEADERS)
 
 
 @router.get("/status")
@@ -55,7 +87,7 @@ async def status():
         }
         
     except Exception as e:
-        logger.error(f"Error getting status: {e}")
+        logger.error("Error getting status: %s", e)
         return {
             "status": "degraded",
             "error": str(e)
@@ -75,13 +107,14 @@ async def readiness():
         if browser_pool.browser_count_actual == 0:
             return {"ready": False, "reason": "No browsers available"}
         
-        return {"ready": True}
+        return Response(content=_READY_BODY, media_type="application/json")
         
     except Exception as e:
         return {"ready": False, "reason": str(e)}
 
 
 @router.get("/live")
-async def liveness():
+@router.head("/live", include_in_schema=False)
+async def liveness(request: Request):
     """Kubernetes liveness probe"""
-    return {"alive": True}
+    return _probe_response(request, _LIVE_BODY, _LIVE_HEADERS)
@@ -11,15 +11,24 @@ ALL ROUTES ARE ASYNC - This is critical for:
 """
 
 import logging
+import re
 import time
 import asyncio
-from typing import Dict, Any, Optional, List
+import itertools
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, Any, Final, Optional, List
+
+import msgspec
+import orjson
 from pydantic import BaseModel, Field
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request
+from fastapi.responses import StreamingResponse
 
 from ...core.task_manager import get_task_manager, TaskStatus
-from ...core.config import get_config
+from ...core.config import get_config, get_price
+from .common import openapi_body, json_response, bad_request
 from ..middleware.auth import validate_api_key, deduct_balance
 from ...solvers import solve_captcha
 
@@ -66,6 +75,7 @@ class GetTaskResultRequest(BaseModel):
     """Request body for /getTaskResult"""
     clientKey: str
     taskId: str
+    waitMs: int = Field(default=0, ge=0, le=30000)
 
 
 class DirectSolveRequest(BaseModel):
@@ -80,21 +90,115 @@ class DirectSolveRequest(BaseModel):
     enterprise_payload: Optional[Dict[str, Any]] = None
 
 
+# =============================================================================
+# MSGSPEC STRUCTS - hot-path body decoding
+# =============================================================================
+# /createTask and /solve decode their bodies with msgspec: parse + type
+# validation in one C pass into slotted Structs. The Pydantic models above
+# stay as the OpenAPI schema and must be kept in sync. Decoders run with
+# strict=False to keep Pydantic's lax coercion ("port": "8080",
+# "isInvisible": "true" / 1), which 2captcha-style clients rely on.
+
+class ProxyBody(msgspec.Struct, frozen=True):
+    """Decoded proxy config (mirrors ProxyConfig)"""
+    address: str
+    port: int
+    type: str = "http"
+    username: Optional[str] = None
+    password: Optional[str] = None
+
+
+class TaskBody(msgspec.Struct, frozen=True, kw_only=True):
+    """Decoded task data (mirrors TaskData)"""
+    type: str = "RecaptchaV2TaskProxyless"
+    websiteURL: str
+    websiteKey: str
+    recaptchaType: Optional[str] = "normal"
+    isInvisible: Optional[bool] = False
+    proxy: Optional[ProxyBody] = None
+    userAgent: Optional[str] = None
+    cookies: Optional[str] = None
+    pageAction: Optional[str] = None
+    enterprisePayload: Optional[Dict[str, Any]] = None
+    apiDomain: Optional[str] = None
+
+
+class CreateTaskBody(msgspec.Struct, frozen=True):
+    """Decoded body for /createTask (mirrors CreateTaskRequest)"""
+    clientKey: str
+    task: TaskBody
+
+
+class DirectSolveBody(msgspec.Struct, frozen=True):
+    """Decoded body for /solve (mirrors DirectSolveRequest)"""
+    api_key: str
+    url: str
+    sitekey: str
+    type: str = "normal"
+    proxy: Optional[str] = None
+    invisible: bool = False
+    action: Optional[str] = None
+    enterprise_payload: Optional[Dict[str, Any]] = None
+
+
+_CREATE_TASK_DECODER = msgspec.json.Decoder(CreateTaskBody, strict=False)
+_DIRECT_SOLVE_DECODER = msgspec.json.Decoder(DirectSolveBody, strict=False)
+
+
 # =============================================================================
 # ERROR CODES - 2Captcha compatible
 # =============================================================================
 
-ERROR_CODES = {
-    "SUCCESS": 0,
-    "ERROR_KEY_DOES_NOT_EXIST": 1,
-    "ERROR_NO_SLOT_AVAILABLE": 2,
-    "ERROR_ZERO_BALANCE": 3,
-    "ERROR_WRONG_CAPTCHA_ID": 10,
-    "ERROR_TIMEOUT": 11,
-    "ERROR_RECAPTCHA_BLOCKED": 12,
-    "ERROR_PROXY_CONNECT_REFUSED": 13,
-    "ERROR_CAPTCHA_UNSOLVABLE": 14,
-    "ERROR_BAD_PARAMETERS": 15,
+# Plain int constants: failure branches read a global, no dict lookup
+SUCCESS: Final[int] = 0
+ERROR_KEY_DOES_NOT_EXIST: Final[int] = 1
+ERROR_NO_SLOT_AVAILABLE: Final[int] = 2
+ERROR_ZERO_BALANCE: Final[int] = 3
+ERROR_WRONG_CAPTCHA_ID: Final[int] = 10
+ERROR_TIMEOUT: Final[int] = 11
+ERROR_RECAPTCHA_BLOCKED: Final[int] = 12
+ERROR_PROXY_CONNECT_REFUSED: Final[int] = 13
+ERROR_CAPTCHA_UNSOLVABLE: Final[int] = 14
+ERROR_BAD_PARAMETERS: Final[int] = 15
+ERROR_INTERNAL: Final[int] = 99
+
+
+class ErrorCode(IntEnum):
+    """2Captcha-compatible errorId values"""
+    SUCCESS = SUCCESS
+    ERROR_KEY_DOES_NOT_EXIST = ERROR_KEY_DOES_NOT_EXIST
+    ERROR_NO_SLOT_AVAILABLE = ERROR_NO_SLOT_AVAILABLE
+    ERROR_ZERO_BALANCE = ERROR_ZERO_BALANCE
+    ERROR_WRONG_CAPTCHA_ID = ERROR_WRONG_CAPTCHA_ID
+    ERROR_TIMEOUT = ERROR_TIMEOUT
+    ERROR_RECAPTCHA_BLOCKED = ERROR_RECAPTCHA_BLOCKED
+    ERROR_PROXY_CONNECT_REFUSED = ERROR_PROXY_CONNECT_REFUSED
+    ERROR_CAPTCHA_UNSOLVABLE = ERROR_CAPTCHA_UNSOLVABLE
+    ERROR_BAD_PARAMETERS = ERROR_BAD_PARAMETERS
+    ERROR_INTERNAL = ERROR_INTERNAL
+
+
+# Name -> errorId, kept for existing importers
+ERROR_CODES: Dict[str, int] = {code.name: code.value for code in ErrorCode}
+
+# Static error bodies, serialized once at import
+_ERR_INVALID_KEY = orjson.dumps({
+    "errorId": ERROR_KEY_DOES_NOT_EXIST,
+    "errorMessage": "Invalid API key",
+})
+_ERR_TASK_NOT_FOUND = orjson.dumps({
+    "errorId": ERROR_WRONG_CAPTCHA_ID,
+    "errorMessage": "Task not found",
+})
+_ERR_QUEUE_FULL = orjson.dumps({
+    "errorId": ERROR_NO_SLOT_AVAILABLE,
+    "errorMessage": "Task queue is full, try again later",
+})
+
+# Most /getTaskResult polls see an unfinished task, whose body never varies
+_UNFINISHED_BODIES: Dict[TaskStatus, bytes] = {
+    status: orjson.dumps({"errorId": SUCCESS, "status": status.value})
+    for status in (TaskStatus.PENDING, TaskStatus.PROCESSING)
 }
 
 
@@ -102,20 +206,44 @@ ERROR_CODES = {
 # HELPER FUNCTIONS
 # =============================================================================
 
-def parse_proxy(proxy_data: Optional[ProxyConfig]) -> Optional[Dict]:
+@lru_cache(maxsize=4096)
+def _build_proxy(
+    scheme: str,
+    host: str,
+    port,
+    username: Optional[str],
+    password: Optional[str],
+) -> Dict:
+    """
+    Build (once per distinct proxy) the Playwright proxy dict.
+    
+    The returned dict is shared between requests and must not be
+    mutated. It stays a plain dict because Playwright JSON-serializes
+    the context options.
+    """
+    proxy = {"server": f"{scheme}://{host}:{port}"}
+    if username and password:
+        proxy["username"] = username
+        proxy["password"] = password
+    return proxy
+
+
+def parse_proxy(proxy_data: Optional["ProxyBody"]) -> Optional[Dict]:
     """Parse proxy configuration from request"""
     if not proxy_data:
         return None
     
-    proxy = {
-        "server": f"{proxy_data.type}://{proxy_data.address}:{proxy_data.port}"
-    }
-    
-    if proxy_data.username and proxy_data.password:
-        proxy["username"] = proxy_data.username
-        proxy["password"] = proxy_data.password
-    
-    return proxy
+    return _build_proxy(
+        proxy_data.type,
+        proxy_data.address,
+        proxy_data.port,
+        proxy_data.username,
+        proxy_data.password,
+    )
+
+
+# host:port[:user:pass] - anything after the 4th field is ignored
+_PROXY_RE = re.compile(r"([^:]+):([^:]+)(?::([^:]+):([^:]+))?")
 
 
 def parse_proxy_string(proxy_str: Optional[str]) -> Optional[Dict]:
@@ -123,15 +251,76 @@ def parse_proxy_string(proxy_str: Optional[str]) -> Optional[Dict]:
     if not proxy_str:
         return None
     
-    parts = proxy_str.split(':')
-    if len(parts) >= 2:
-        proxy = {"server": f"http://{parts[0]}:{parts[1]}"}
-        if len(parts) >= 4:
-            proxy["username"] = parts[2]
-            proxy["password"] = parts[3]
-        return proxy
+    match = _PROXY_RE.match(proxy_str)
+    if not match:
+        return None
     
-    return None
+    host, port, username, password = match.groups()
+    return _build_proxy("http", host, port, username, password)
+
+
+# =============================================================================
+# IN-FLIGHT SOLVE SHARING (solver.share_inflight_solves)
+# =============================================================================
+# Bursts often ask for the same (url, sitekey, ...) within seconds. With the
+# flag on, concurrent identical requests await one shared solve instead of
+# each taking a browser. Off by default: reCAPTCHA tokens are normally
+# single-use, so sharing only suits sites that accept a token more than once.
+
+_inflight: Dict[tuple, asyncio.Task] = {}
+
+
+async def _solve(
+    url: str,
+    sitekey: str,
+    captcha_type: str,
+    proxy: Optional[Dict],
+    is_invisible: bool,
+    action: Optional[str],
+    enterprise_payload: Optional[Dict],
+    client_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    solve_captcha(), shared between identical in-flight calls when enabled.
+    
+    Only calls from the same client through the same proxy (server and
+    credentials) share a solve, so a token is never minted through another
+    tenant's proxy or exit IP.
+    """
+    kwargs = dict(
+        url=url,
+        sitekey=sitekey,
+        captcha_type=captcha_type,
+        proxy=proxy,
+        is_invisible=is_invisible,
+        action=action,
+        enterprise_payload=enterprise_payload,
+    )
+    
+    if not get_config().solver.share_inflight_solves:
+        return await solve_captcha(**kwargs)
+    
+    key = (
+        client_key,
+        url,
+        sitekey,
+        captcha_type,
+        (proxy["server"], proxy.get("username"), proxy.get("password")) if proxy else None,
+        is_invisible,
+        action,
+        orjson.dumps(enterprise_payload, option=orjson.OPT_SORT_KEYS) if enterprise_payload else None,
+    )
+    
+    shared = _inflight.get(key)
+    if shared is None:
+        shared = asyncio.create_task(solve_captcha(**kwargs))
+        _inflight[key] = shared
+        shared.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        logger.debug("Joining in-flight solve for %s", url)
+    
+    # Shielded: one caller being cancelled must not cancel the shared solve
+    return await asyncio.shield(shared)
 
 
 # =============================================================================
@@ -157,7 +346,7 @@ async def process_task(task_id: str):
     
     try:
         # Solve the captcha (fully async!)
-        result = await solve_captcha(
+        result = await _solve(
             url=task.website_url,
             sitekey=task.website_key,
             captcha_type=task.recaptcha_type,
@@ -165,12 +354,11 @@ async def process_task(task_id: str):
             is_invisible=task.is_invisible,
             action=task.page_action,
             enterprise_payload=task.enterprise_payload,
+            client_key=task.client_key,
         )
         
         if result.get('success'):
-            # Get pricing
-            config = get_config()
-            price = getattr(config.pricing, f"{task.recaptcha_type}_v2", 0.001)
+            price = get_price(task.recaptcha_type)
             
             # Deduct balance
             await deduct_balance(task.client_key, price)
@@ -189,27 +377,171 @@ async def process_task(task_id: str):
             task_manager.update_task_status(
                 task_id,
                 TaskStatus.FAILED,
-                error_id=ERROR_CODES.get("ERROR_CAPTCHA_UNSOLVABLE", 14),
+                error_id=ERROR_CAPTCHA_UNSOLVABLE,
                 error_message=result.get('error', 'Failed to solve')
             )
             
     except Exception as e:
-        logger.error(f"Error processing task {task_id}: {e}")
+        logger.error("Error processing task %s: %s", task_id, e, exc_info=True)
         task_manager.update_task_status(
             task_id,
             TaskStatus.FAILED,
-            error_id=99,
+            error_id=ERROR_INTERNAL,
             error_message=str(e)
         )
 
 
+# =============================================================================
+# TASK WORKERS - bounded queue instead of one coroutine per request
+# =============================================================================
+# /createTask bursts would otherwise start one solve coroutine per request,
+# each contending for the browser pool. Jobs are queued instead and a
+# fixed number of workers (rate_limit.concurrent_tasks) drain the queue.
+#
+# Queue entries are (priority, seq, job). /solve clients hold their
+# connection open for the result, so their jobs go ahead of queued
+# /createTask IDs; seq keeps FIFO order within a priority.
+
+TASK_QUEUE_MAX_SIZE = 1000
+
+PRIORITY_DIRECT = 0  # /solve: (kwargs, future) awaited by the handler
+PRIORITY_TASK = 1    # /createTask: task ID, polled by the client
+
+_task_queue: Optional[asyncio.PriorityQueue] = None
+_task_workers: List[asyncio.Task] = []
+_task_seq = itertools.count()
+
+
+async def _run_direct_job(kwargs: Dict[str, Any], future: asyncio.Future):
+    """Solve a queued /solve job and hand the result to its handler."""
+    if future.cancelled():  # Client disconnected while queued
+        return
+    try:
+        result = await _solve(**kwargs)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        if not future.done():
+            future.set_exception(e)
+    else:
+        if not future.done():
+            future.set_result(result)
+
+
+async def _task_worker():
+    """Process queued jobs until cancelled."""
+    assert _task_queue is not None
+    
+    while True:
+        _, _, job = await _task_queue.get()
+        try:
+            if isinstance(job, str):
+                await process_task(job)
+            else:
+                await _run_direct_job(*job)
+        finally:
+            _task_queue.task_done()
+
+
+def enqueue_task(task_id: str) -> None:
+    """Queue a /createTask task ID (raises asyncio.QueueFull)."""
+    assert _task_queue is not None
+    _task_queue.put_nowait((PRIORITY_TASK, next(_task_seq), task_id))
+
+
+async def _solve_queued(**kwargs) -> Dict[str, Any]:
+    """Run a /solve job through the worker pool, ahead of queued tasks."""
+    if _task_queue is None:
+        return await _solve(**kwargs)
+    
+    future = asyncio.get_running_loop().create_future()
+    _task_queue.put_nowait((PRIORITY_DIRECT, next(_task_seq), (kwargs, future)))
+    return await future
+
+
+def start_task_workers():
+    """Start the task worker pool (call once at startup)."""
+    global _task_queue
+    
+    if _task_workers:
+        return
+    
+    worker_count = get_config().rate_limit.concurrent_tasks
+    _task_queue = asyncio.PriorityQueue(maxsize=TASK_QUEUE_MAX_SIZE)
+    _task_workers.extend(
+        asyncio.create_task(_task_worker()) for _ in range(worker_count)
+    )
+    logger.info("Started %d task workers", worker_count)
+
+
+async def stop_task_workers():
+    """Cancel the task workers (in-flight solves are abandoned)."""
+    global _task_queue
+    
+    if not _task_workers:
+        return
+    
+    for worker in _task_workers:
+        worker.cancel()
+    await asyncio.gather(*_task_workers, return_exceptions=True)
+    
+    _task_workers.clear()
+    _task_queue = None
+    logger.info("Task workers stopped")
+
+
+# Upper bound for /getTaskResult long-polling
+MAX_WAIT_MS = 30000
+
+# /getTaskResult/stream: status re-check interval and keep-alive period
+STREAM_TICK_S = 1.0
+STREAM_KEEPALIVE_S = 15.0
+
+
+def _result_body(task) -> bytes:
+    """Serialized /getTaskResult body for the task's current state"""
+    unfinished = _UNFINISHED_BODIES.get(task.status)
+    if unfinished is not None:
+        return unfinished
+    return orjson.dumps(task.get_result())
+
+
+async def _task_events(task):
+    """
+    SSE stream of a task's /getTaskResult body.
+    
+    Emits the current body, then one event per status change, and ends
+    after the finished (ready/failed) body. Completion is pushed via
+    task.done; the pending -> processing step is picked up each tick.
+    """
+    last = None
+    idle = 0.0
+    while True:
+        body = _result_body(task)
+        if body != last:
+            yield b"data: " + body + b"\n\n"
+            last = body
+            idle = 0.0
+        if task.is_finished:
+            return
+        
+        try:
+            await asyncio.wait_for(task.done.wait(), STREAM_TICK_S)
+        except asyncio.TimeoutError:
+            idle += STREAM_TICK_S
+            if idle >= STREAM_KEEPALIVE_S:
+                yield b": keep-alive\n\n"
+                idle = 0.0
+
+
 # =============================================================================
 # ROUTES - All async!
 # =============================================================================
 
-@router.post("/createTask")
+@router.post("/createTask", openapi_extra=openapi_body(CreateTaskRequest))
 async def create_task(
-    request: CreateTaskRequest,
+    request: Request,
     background_tasks: BackgroundTasks
 ):
     """
@@ -241,85 +573,93 @@ async def create_task(
     ```
     """
     try:
-        # Validate API key and get key data in one call
-        key_valid, key_error, key_data = await validate_api_key(request.clientKey)
-        if not key_valid:
-            return {
-                "errorId": ERROR_CODES["ERROR_KEY_DOES_NOT_EXIST"],
-                "errorMessage": key_error
-            }
-        
-        # Get user's thread limit from key_data (no extra DB call!)
-        max_threads = key_data.get("max_threads", 5) if key_data else 5
-        
-        # Check current active task count
-        task_manager = get_task_manager()
-        active_count = task_manager.get_active_count_for_user(request.clientKey)
-        
-        if active_count >= max_threads:
-            return {
-                "errorId": ERROR_CODES.get("ERROR_NO_SLOT_AVAILABLE", 2),
-                "errorMessage": f"Maximum thread limit reached ({active_count}/{max_threads})"
-            }
-        
-        task_data = request.task
-        
-        # Determine reCAPTCHA type
-        recaptcha_type = task_data.recaptchaType or "normal"
-        if task_data.isInvisible:
-            recaptcha_type = "invisible"
-        if "Enterprise" in task_data.type:
-            recaptcha_type = "enterprise"
-        
-        # Parse proxy
-        proxy = parse_proxy(task_data.proxy)
-        
-        # Create task
-        task_manager = get_task_manager()
-        task = task_manager.create_task(
-            task_type=task_data.type,
-            website_url=task_data.websiteURL,
-            website_key=task_data.websiteKey,
-            recaptcha_type=recaptcha_type,
-            client_key=request.clientKey,
-            proxy=proxy,
-            user_agent=task_data.userAgent,
-            cookies=task_data.cookies,
-            is_invisible=task_data.isInvisible or False,
-            page_action=task_data.pageAction,
-            enterprise_payload=task_data.enterprisePayload,
-            api_domain=task_data.apiDomain,
-        )
-        
-        # Start background processing
-        # FastAPI's BackgroundTasks integrates properly with asyncio
-        background_tasks.add_task(process_task, task.id)
-        
+        body = _CREATE_TASK_DECODER.decode(await request.body())
+    except msgspec.DecodeError:  # also covers msgspec.ValidationError
+        return bad_request()
+    
+    # Validate API key and get key data in one call
+    key_valid, key_error, key_data = await validate_api_key(body.clientKey)
+    if not key_valid:
         return {
-            "errorId": 0,
-            "taskId": task.id
+            "errorId": ERROR_KEY_DOES_NOT_EXIST,
+            "errorMessage": key_error
         }
-        
-    except Exception as e:
-        logger.error(f"Error creating task: {e}")
+    
+    # Get user's thread limit from key_data (no extra DB call!)
+    max_threads = key_data.get("max_threads", 5) if key_data else 5
+    
+    # Check current active task count
+    task_manager = get_task_manager()
+    active_count = task_manager.get_active_count_for_user(body.clientKey)
+    
+    if active_count >= max_threads:
         return {
-            "errorId": 99,
-            "errorMessage": str(e)
+            "errorId": ERROR_NO_SLOT_AVAILABLE,
+            "errorMessage": f"Maximum thread limit reached ({active_count}/{max_threads})"
         }
+    
+    task_data = body.task
+    
+    # Determine reCAPTCHA type
+    recaptcha_type = task_data.recaptchaType or "normal"
+    if task_data.isInvisible:
+        recaptcha_type = "invisible"
+    if "Enterprise" in task_data.type:
+        recaptcha_type = "enterprise"
+    
+    # Parse proxy
+    proxy = parse_proxy(task_data.proxy)
+    
+    # Create task
+    task = task_manager.create_task(
+        task_type=task_data.type,
+        website_url=task_data.websiteURL,
+        website_key=task_data.websiteKey,
+        recaptcha_type=recaptcha_type,
+        client_key=body.clientKey,
+        proxy=proxy,
+        user_agent=task_data.userAgent,
+        cookies=task_data.cookies,
+        is_invisible=task_data.isInvisible or False,
+        page_action=task_data.pageAction,
+        enterprise_payload=task_data.enterprisePayload,
+        api_domain=task_data.apiDomain,
+    )
+    
+    # Hand off to the worker pool; without it (e.g. the app was built
+    # without the framework lifespan) fall back to BackgroundTasks,
+    # which runs the solve on this loop after the response is sent.
+    if _task_queue is None:
+        background_tasks.add_task(process_task, task.id)
+    else:
+        try:
+            enqueue_task(task.id)
+        except asyncio.QueueFull:
+            task_manager.delete_task(task.id)
+            return json_response(_ERR_QUEUE_FULL)
+    
+    return {
+        "errorId": SUCCESS,
+        "taskId": task.id
+    }
 
 
-@router.post("/getTaskResult")
-async def get_task_result(request: GetTaskResultRequest):
+@router.post("/getTaskResult", openapi_extra=openapi_body(GetTaskResultRequest))
+async def get_task_result(request: Request):
     """
     Get the result of a task.
     
     Poll this endpoint until status is "ready" or "failed".
     
+    Optional "waitMs" (0-30000) long-polls: the request is held until the
+    task finishes or waitMs elapses, so one request replaces many polls.
+    
     Request:
     ```json
     {
         "clientKey": "api-key",
-        "taskId": "uuid"
+        "taskId": "uuid",
+        "waitMs": 10000
     }
     ```
     
@@ -342,44 +682,97 @@ async def get_task_result(request: GetTaskResultRequest):
     }
     ```
     """
+    # Polled constantly: orjson + two type checks instead of a Pydantic model
     try:
-        # Validate API key
-        key_valid, _, _ = await validate_api_key(request.clientKey)
-        if not key_valid:
-            return {
-                "errorId": ERROR_CODES["ERROR_KEY_DOES_NOT_EXIST"],
-                "errorMessage": "Invalid API key"
-            }
-        
-        # Get task
-        task_manager = get_task_manager()
-        task = task_manager.get_task(request.taskId)
-        
-        if not task:
-            return {
-                "errorId": ERROR_CODES["ERROR_WRONG_CAPTCHA_ID"],
-                "errorMessage": "Task not found"
-            }
-        
-        # Verify ownership
-        if task.client_key != request.clientKey:
-            return {
-                "errorId": ERROR_CODES["ERROR_WRONG_CAPTCHA_ID"],
-                "errorMessage": "Task not found"
-            }
-        
-        return task.get_result()
-        
-    except Exception as e:
-        logger.error(f"Error getting task result: {e}")
-        return {
-            "errorId": 99,
-            "errorMessage": str(e)
-        }
+        data = orjson.loads(await request.body())
+        client_key = data["clientKey"]
+        task_id = data["taskId"]
+        wait_ms = data.get("waitMs", 0)
+        if not (isinstance(client_key, str) and isinstance(task_id, str)):
+            raise TypeError("clientKey and taskId must be strings")
+        if not isinstance(wait_ms, int) or not 0 <= wait_ms <= MAX_WAIT_MS:
+            raise ValueError("waitMs must be an integer between 0 and 30000")
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        return bad_request()
+    
+    # Validate API key
+    key_valid, _, _ = await validate_api_key(client_key)
+    if not key_valid:
+        return json_response(_ERR_INVALID_KEY)
+    
+    # Get task
+    task_manager = get_task_manager()
+    task = task_manager.get_task(task_id)
+    
+    if not task:
+        return json_response(_ERR_TASK_NOT_FOUND)
+    
+    # Verify ownership
+    if task.client_key != client_key:
+        return json_response(_ERR_TASK_NOT_FOUND)
+    
+    # Long-poll: hold the request until the task finishes or waitMs elapses
+    if wait_ms and not task.is_finished:
+        try:
+            await asyncio.wait_for(task.done.wait(), wait_ms / 1000)
+        except asyncio.TimeoutError:
+            pass
+    
+    return json_response(_result_body(task))
 
 
-@router.post("/solve")
-async def solve_direct(request: DirectSolveRequest):
+@router.post("/getTaskResult/stream", openapi_extra=openapi_body(GetTaskResultRequest))
+async def stream_task_result(request: Request):
+    """
+    Stream a task's result as Server-Sent Events.
+    
+    One request per task instead of repeated polling: each event's data
+    is the same JSON /getTaskResult returns, sent on every status change;
+    the stream closes after the "ready" / "failed" event.
+    
+    Request:
+    ```json
+    {
+        "clientKey": "api-key",
+        "taskId": "uuid"
+    }
+    ```
+    
+    Response (text/event-stream):
+    ```
+    data: {"errorId":0,"status":"processing"}
+    
+    data: {"errorId":0,"status":"ready","solution":{...}}
+    ```
+    
+    Key / task errors are returned as a plain JSON body, as on /getTaskResult.
+    """
+    try:
+        data = orjson.loads(await request.body())
+        client_key = data["clientKey"]
+        task_id = data["taskId"]
+        if not (isinstance(client_key, str) and isinstance(task_id, str)):
+            raise TypeError("clientKey and taskId must be strings")
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        return bad_request()
+    
+    key_valid, _, _ = await validate_api_key(client_key)
+    if not key_valid:
+        return json_response(_ERR_INVALID_KEY)
+    
+    task = get_task_manager().get_task(task_id)
+    if not task or task.client_key != client_key:
+        return json_response(_ERR_TASK_NOT_FOUND)
+    
+    return StreamingResponse(
+        _task_events(task),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/solve", openapi_extra=openapi_body(DirectSolveRequest))
+async def solve_direct(request: Request):
     """
     Direct/simple solve endpoint - blocks until solution is ready.
     
@@ -405,35 +798,43 @@ async def solve_direct(request: DirectSolveRequest):
     }
     ```
     """
+    try:
+        body = _DIRECT_SOLVE_DECODER.decode(await request.body())
+    except msgspec.DecodeError:  # also covers msgspec.ValidationError
+        return bad_request()
+    
     try:
         # Validate API key
-        key_valid, key_error, _ = await validate_api_key(request.api_key)
+        key_valid, key_error, _ = await validate_api_key(body.api_key)
         if not key_valid:
             return {"success": False, "error": key_error}
         
         # Parse proxy string
-        proxy = parse_proxy_string(request.proxy)
+        proxy = parse_proxy_string(body.proxy)
         
         # Solve - this is now properly async!
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        result = await solve_captcha(
-            url=request.url,
-            sitekey=request.sitekey,
-            captcha_type=request.type,
-            proxy=proxy,
-            is_invisible=request.invisible,
-            action=request.action,
-            enterprise_payload=request.enterprise_payload,
-        )
+        try:
+            result = await _solve_queued(
+                url=body.url,
+                sitekey=body.sitekey,
+                captcha_type=body.type,
+                proxy=proxy,
+                is_invisible=body.invisible,
+                action=body.action,
+                enterprise_payload=body.enterprise_payload,
+                client_key=body.api_key,
+            )
+        except asyncio.QueueFull:
+            return {"success": False, "error": "Task queue is full, try again later"}
         
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         
         if result.get('success'):
             # Deduct balance
-            config = get_config()
-            price = getattr(config.pricing, f"{request.type}_v2", 0.001)
-            await deduct_balance(request.api_key, price)
+            price = get_price(body.type)
+            await deduct_balance(body.api_key, price)
             
             return {
                 "success": True,
@@ -450,5 +851,5 @@ async def solve_direct(request: DirectSolveRequest):
             }
         
     except Exception as e:
-        logger.error(f"Error in direct solve: {e}")
+        logger.error("Error in direct solve: %s", e, exc_info=True)
         return {"success": False, "error": str(e)}
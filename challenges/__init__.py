@@ -4,14 +4,17 @@ Challenge Solvers Module
 
 Contains audio and image challenge solvers.
 
-YOLO MODEL SINGLETON:
---------------------
-The YOLO model is loaded ONCE at server startup and shared across all requests.
+MODEL SINGLETONS:
+----------------
+The YOLO and Whisper models are loaded ONCE at server startup and shared
+across all requests.
 
 Usage:
     # At startup (main.py):
     from challenges.image_solver import load_yolo_model
+    from challenges.audio_solver import load_whisper_model
     load_yolo_model()
+    load_whisper_model()
     
     # In request handlers:
     from challenges.image_solver import get_yolo_model
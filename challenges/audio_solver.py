@@ -6,23 +6,459 @@ Handles reCAPTCHA audio challenges using speech recognition.
 
 OPTIMIZATIONS:
 --------------
-1. Audio Cleaning: Normalize + remove silence via pydub before Whisper
-2. Whisper Tuning: Medium model + initial_prompt for digit recognition
+1. Audio Cleaning: Decode once, normalize + remove silence + low-pass in
+   NumPy, hand the float32 array straight to Whisper (no re-encode)
+2. Whisper Tuning: Medium model + initial_prompt for digit recognition,
+   served by faster-whisper (CTranslate2 int8) when installed
 3. Stealth Download: User-Agent header matching browser fingerprint
 4. Error Handling: AudioRateLimitError for immediate YOLO fallback
 """
 
 import os
+import hashlib
 import logging
-import tempfile
 import asyncio
-import aiohttp
-from typing import Dict, Any, Optional
+import subprocess
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+import numpy as np
+
+from ..utils.http import get_http_session
+from ..utils.recaptcha_dom import (
+    ANCHOR_IFRAME_SELECTOR,
+    CHALLENGE_IFRAME_SELECTOR,
+    IS_CHECKED_SCRIPT,
+)
+
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# GLOBAL SINGLETON - Whisper Model
+# =============================================================================
+
+# The model instance - loaded ONCE, used by ALL requests
+_whisper_model = None
+_whisper_model_lock = asyncio.Lock()
+
+
+def _whisper_device() -> str:
+    """"cuda" when a GPU is visible, else "cpu"."""
+    try:
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        return "cpu"
+
+
+def _load_faster_whisper(model_name: str, device: str):
+    """faster-whisper (CTranslate2): float16 on GPU, int8 weights on CPU."""
+    from faster_whisper import WhisperModel  # type: ignore
+    
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type="float16" if device == "cuda" else "int8",
+        cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+        num_workers=2,  # concurrent transcribe() calls from the executor
+    )
+
+
+def _compile_whisper_encoder(model) -> None:
+    """
+    torch.compile the openai-whisper encoder for its fixed input shape.
+    
+    Every clip is padded to Whisper's 30s window, so the encoder only
+    ever sees (batch, n_mels, 3000) mels; with dynamic=False each batch
+    size is specialized once and reused. The decoder is left eager: its
+    token length grows every step and its KV cache works through hooks.
+    """
+    import torch
+    
+    # One graph per micro-batch size
+    torch._dynamo.config.cache_size_limit = max(
+        torch._dynamo.config.cache_size_limit, WHISPER_MAX_BATCH
+    )
+    model.encoder = torch.compile(
+        model.encoder,
+        mode="reduce-overhead" if model.device.type == "cuda" else "default",
+        dynamic=False,
+    )
+    
+    # Compile now (single-clip shape) rather than on the first solve
+    with torch.no_grad():
+        dtype = torch.float16 if model.device.type == "cuda" else torch.float32
+        model.encoder(torch.zeros(
+            1, model.dims.n_mels, model.dims.n_audio_ctx * 2,
+            device=model.device, dtype=dtype,
+        ))
+
+
+def load_whisper_model(model_name: Optional[str] = None):
+    """
+    Load the Whisper model into memory (SINGLETON).
+    
+    This should be called ONCE during server startup.
+    The model stays in memory for the lifetime of the server.
+    
+    Backend (config.solver.audio.whisper_backend):
+    - "faster": faster-whisper / CTranslate2 int8 (several times faster
+      on CPU, ~4x less memory). Falls back to "openai" if not installed.
+    - "openai": reference openai-whisper (PyTorch FP32); with
+      whisper_compile the encoder is torch.compile'd at load time
+    
+    Args:
+        model_name: Optional Whisper model name. If None, uses config.
+    
+    Returns:
+        Whisper model instance
+    
+    Usage:
+        # In main.py lifespan startup:
+        model = load_whisper_model()
+    """
+    global _whisper_model
+    
+    if _whisper_model is not None:
+        logger.debug("Whisper model already loaded (singleton)")
+        return _whisper_model
+    
+    try:
+        from ..core.config import get_config
+        
+        audio_config = get_config().solver.audio
+        if model_name is None:
+            model_name = audio_config.whisper_model
+        device = _whisper_device()
+        
+        if audio_config.whisper_backend == "faster":
+            try:
+                logger.info("Loading faster-whisper model: %s on %s", model_name, device)
+                _whisper_model = _load_faster_whisper(model_name, device)
+            except ImportError:
+                logger.warning("faster-whisper not installed, falling back to openai-whisper")
+        
+        if _whisper_model is None:
+            import whisper  # type: ignore
+            
+            logger.info("Loading Whisper model: %s on %s", model_name, device)
+            _whisper_model = whisper.load_model(model_name, device=device)
+            
+            if audio_config.whisper_compile:
+                logger.info("Compiling Whisper encoder (one-time)...")
+                _compile_whisper_encoder(_whisper_model)
+        
+        logger.info("Whisper model loaded successfully: %s", model_name)
+        return _whisper_model
+        
+    except Exception as e:
+        logger.error("Failed to load Whisper model: %s", e)
+        raise
+
+
+# Initial prompt tuned for reCAPTCHA audio challenges
+# Primes Whisper to expect digits and letters
+WHISPER_INITIAL_PROMPT = (
+    "The audio contains spoken digits and letters. "
+    "Examples: 7 3 9 2 5, a b c d e, 4 8 1 6 0, "
+    "m n p q r, 2 4 6 8 0."
+)
+
+
+def _is_faster_whisper(model) -> bool:
+    """True for a faster_whisper.WhisperModel, False for openai-whisper."""
+    return hasattr(model, "feature_extractor")
+
+
+def _run_whisper(model, audio: np.ndarray) -> str:
+    """
+    Blocking single-clip transcription with faster-whisper (runs in a
+    worker thread). Greedy, unconditioned, timestamp-free decoding with
+    the same thresholds as the batched openai-whisper path.
+    """
+    segments, _ = model.transcribe(
+        audio,
+        language="en",
+        initial_prompt=WHISPER_INITIAL_PROMPT,
+        temperature=0.0,
+        beam_size=1,
+        best_of=1,
+        condition_on_previous_text=False,  # no cross-window repetition loops
+        without_timestamps=True,           # clips are short; timestamps unused
+        compression_ratio_threshold=2.4,
+        log_prob_threshold=-1.0,
+        no_speech_threshold=0.6,
+    )
+    return "".join(segment.text for segment in segments)
+
+
+# =============================================================================
+# WHISPER MICRO-BATCHER (openai-whisper backend)
+# =============================================================================
+# Concurrent solves would otherwise each run the encoder at batch=1.
+# Clips are queued; the batcher waits up to WHISPER_BATCH_WAIT for more,
+# then decodes up to WHISPER_MAX_BATCH of them in one forward pass.
+# reCAPTCHA clips are far below Whisper's 30s window, so every mel pads
+# to the same (n_mels, 3000) shape and stacks without extra padding logic.
+
+WHISPER_MAX_BATCH = 8
+WHISPER_BATCH_WAIT = 0.04  # seconds
+
+
+# STFT windows per device (whisper.log_mel_spectrogram rebuilds one per call;
+# its mel filterbank is already cached by whisper.audio.mel_filters)
+_hann_windows: Dict[str, Any] = {}
+
+
+def _log_mel_batch(model, audios: List[np.ndarray]):
+    """
+    Log-mel spectrograms for a whole batch in one STFT on the model's device.
+    
+    Same math as whisper.log_mel_spectrogram, but batched, with a cached
+    window, and the dynamic-range clamp taken per clip (not batch-wide).
+    """
+    import torch
+    import whisper  # type: ignore
+    from whisper.audio import N_FFT, HOP_LENGTH, mel_filters  # type: ignore
+    
+    device = model.device
+    window = _hann_windows.get(str(device))
+    if window is None:
+        window = _hann_windows[str(device)] = torch.hann_window(N_FFT, device=device)
+    
+    audio = torch.from_numpy(np.stack([whisper.pad_or_trim(a) for a in audios])).to(device)
+    stft = torch.stft(audio, N_FFT, HOP_LENGTH, window=window, return_complex=True)
+    magnitudes = stft[..., :-1].abs() ** 2
+    
+    mel_spec = mel_filters(device, model.dims.n_mels) @ magnitudes
+    log_spec = torch.clamp(mel_spec, min=1e-10).log10()
+    log_spec = torch.maximum(log_spec, log_spec.amax(dim=(-2, -1), keepdim=True) - 8.0)
+    return (log_spec + 4.0) / 4.0
+
+
+def _decode_whisper_batch(model, audios: List[np.ndarray]) -> List[str]:
+    """Blocking batched decode (runs in a worker thread)."""
+    import whisper  # type: ignore
+    
+    mels = _log_mel_batch(model, audios)
+    
+    options = whisper.DecodingOptions(
+        language="en",
+        prompt=WHISPER_INITIAL_PROMPT,
+        temperature=0.0,  # Deterministic output
+        fp16=model.device.type == "cuda",  # FP16 on GPU, FP32 on CPU
+        without_timestamps=True,
+    )
+    results = whisper.decode(model, mels, options)
+    
+    # Same no-speech rule as whisper.transcribe()
+    return [
+        "" if result.no_speech_prob > 0.6 and result.avg_logprob < -1.0 else result.text
+        for result in results
+    ]
+
+
+class WhisperBatcher:
+    """Coalesces concurrent openai-whisper transcriptions into batched decodes."""
+    
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def submit(self, model, audio: np.ndarray) -> str:
+        """Queue one clip and wait for its transcription."""
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(model))
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((audio, future))
+        return await future
+    
+    async def _run(self, model):
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + WHISPER_BATCH_WAIT
+            while len(batch) < WHISPER_MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                texts = await loop.run_in_executor(
+                    None, _decode_whisper_batch, model, [audio for audio, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            logger.debug("Whisper batch decoded: %d clip(s)", len(batch))
+            for (_, future), text in zip(batch, texts):
+                if not future.done():
+                    future.set_result(text)
+
+
+_whisper_batcher = WhisperBatcher()
+
+
+# =============================================================================
+# TRANSCRIPTION CACHE
+# =============================================================================
+# reCAPTCHA re-serves the same audio files, so transcriptions are memoized
+# by "<engine>:<sha256 of the downloaded bytes>". Empty results (no speech)
+# are cached too so known-bad clips are not re-processed; engine errors
+# are not. In-process LRU, shared by all solves in this worker.
+
+TRANSCRIPT_CACHE_MAX_SIZE = 1024
+
+_TRANSCRIPT_CACHE: "OrderedDict[str, str]" = OrderedDict()
+
+
+def get_whisper_model():
+    """
+    Get the loaded Whisper model (SINGLETON).
+    
+    Returns None if model hasn't been loaded yet.
+    
+    Returns:
+        Whisper model instance or None
+    """
+    return _whisper_model
+
+
+async def get_whisper_model_async():
+    """
+    Get the Whisper model, loading it if necessary (thread-safe).
+    
+    Uses a lock to prevent multiple simultaneous loads; the load
+    itself runs in a thread pool so the event loop keeps serving.
+    
+    Returns:
+        Whisper model instance
+    """
+    global _whisper_model
+    
+    if _whisper_model is not None:
+        return _whisper_model
+    
+    async with _whisper_model_lock:
+        if _whisper_model is not None:
+            return _whisper_model
+        
+        loop = asyncio.get_running_loop()
+        _whisper_model = await loop.run_in_executor(None, load_whisper_model)
+        return _whisper_model
+
+
+# =============================================================================
+# AUDIO CLEANING - in-memory NumPy DSP
+# =============================================================================
+
+# Whisper's native input: 16 kHz mono float32 in [-1, 1]
+WHISPER_SAMPLE_RATE = 16000
+
+CLEAN_TARGET_DBFS = -20.0       # normalization level (good level for speech)
+CLEAN_SILENCE_THRESH = -40.0    # dBFS below which a frame counts as silence
+CLEAN_MIN_SILENCE_MS = 1000     # only strip silences at least this long
+CLEAN_PADDING_MS = 100          # silence kept either side of speech
+CLEAN_LOWPASS_HZ = 4000         # reCAPTCHA audio is speech, mostly below 4kHz
+_FRAME_MS = 10                  # resolution of the silence detector
+
+
+def _decode_audio(audio_bytes: bytes) -> np.ndarray:
+    """
+    Decode an in-memory audio file to 16 kHz mono float32 samples.
+    
+    One ffmpeg pass over pipes (the format Whisper itself decodes to):
+    no temp file, no intermediate WAV.
+    """
+    result = subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-f", "f32le", "-ac", "1", "-ar", str(WHISPER_SAMPLE_RATE),
+            "pipe:1",
+        ],
+        input=audio_bytes,
+        capture_output=True,
+        check=True,
+    )
+    return np.frombuffer(result.stdout, dtype=np.float32).copy()
+
+
+# Skip Whisper when too little of the clip is speech - it hallucinates
+# on near-silence, and a bogus answer costs a verify + reload round
+VAD_MIN_VOICED_RATIO = 0.10
+MIN_TRANSCRIPT_CHARS = 3
+
+# Known Whisper artifacts on silence / noise (after lowercasing)
+WHISPER_HALLUCINATIONS = frozenset({
+    "you", "thank you", "thanks for watching", "thank you for watching",
+    "bye", "so",
+})
+
+
+def _voiced_ratio(samples: np.ndarray) -> float:
+    """Fraction of _FRAME_MS frames louder than CLEAN_SILENCE_THRESH."""
+    frame_len = WHISPER_SAMPLE_RATE * _FRAME_MS // 1000
+    n_frames = len(samples) // frame_len
+    if n_frames == 0:
+        return 0.0
+    
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len)
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    return float(np.mean(20.0 * np.log10(np.maximum(rms, 1e-10)) > CLEAN_SILENCE_THRESH))
+
+
+def _strip_silence(samples: np.ndarray) -> np.ndarray:
+    """
+    Drop silent runs of at least CLEAN_MIN_SILENCE_MS (leading, trailing
+    and internal), keeping CLEAN_PADDING_MS either side of speech.
+    """
+    frame_len = WHISPER_SAMPLE_RATE * _FRAME_MS // 1000
+    n_frames = len(samples) // frame_len
+    if n_frames == 0:
+        return samples
+    
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len)
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    loud = 20.0 * np.log10(np.maximum(rms, 1e-10)) > CLEAN_SILENCE_THRESH
+    if not loud.any():
+        return samples
+    
+    # Keep every frame within the padding of a loud frame, plus any
+    # silent run too short to strip
+    pad = CLEAN_PADDING_MS // _FRAME_MS
+    keep = np.convolve(loud.astype(np.int32), np.ones(2 * pad + 1, dtype=np.int32), mode="same") > 0
+    
+    edges = np.flatnonzero(np.diff(np.concatenate(([1], loud.view(np.int8), [1]))))
+    for start, end in zip(edges[::2], edges[1::2]):
+        if (end - start) * _FRAME_MS < CLEAN_MIN_SILENCE_MS:
+            keep[start:end] = True
+    
+    keep = np.repeat(keep, frame_len)
+    tail = samples[n_frames * frame_len:]
+    return np.concatenate((samples[:len(keep)][keep], tail if keep[-1] else tail[:0]))
+
+
+def _low_pass(samples: np.ndarray, cutoff_hz: float) -> np.ndarray:
+    """Zero the spectrum above cutoff_hz (one FFT round-trip)."""
+    spectrum = np.fft.rfft(samples)
+    spectrum[int(cutoff_hz * len(samples) / WHISPER_SAMPLE_RATE):] = 0
+    return np.fft.irfft(spectrum, n=len(samples)).astype(np.float32)
+
+
 class AudioRateLimitError(Exception):
     """
     Raised when reCAPTCHA rate-limits audio challenges.
@@ -33,6 +469,34 @@ class AudioRateLimitError(Exception):
     pass
 
 
+# =============================================================================
+# CHALLENGE DOM LOOKUPS
+# =============================================================================
+# Every query_selector / get_attribute is a CDP round trip; related lookups
+# are batched into one selector list (see utils.recaptcha_dom) or one evaluate.
+
+_AUDIO_STATE_SCRIPT = '''() => {
+    const header = document.querySelector('.rc-doscaptcha-header-text');
+    const source = document.querySelector('#audio-source');
+    const link = document.querySelector('.rc-audiochallenge-tdownload-link');
+    return {
+        rateLimited: !!header && (header.textContent || '').toLowerCase().includes('try again later'),
+        audioUrl: (source && source.getAttribute('src')) || (link && link.getAttribute('href')) || null,
+    };
+}'''
+
+# Visible error after a wrong answer ("Multiple correct solutions required")
+_AUDIO_ERROR_SCRIPT = '''() => {
+    const el = document.querySelector('.rc-audiochallenge-error-message');
+    return !!el && el.style.display !== 'none' && !!el.textContent;
+}'''
+
+_AUDIO_CHANGED_SCRIPT = '''(oldUrl) => {
+    const source = document.querySelector('#audio-source');
+    return !!source && !!source.getAttribute('src') && source.getAttribute('src') !== oldUrl;
+}'''
+
+
 class AudioSolver:
     """
     Solves reCAPTCHA audio challenges using speech recognition.
@@ -59,75 +523,85 @@ class AudioSolver:
         Returns:
             dict with 'success' and 'error' keys
         """
+        # Loop invariants: the bframe and audio mode persist across attempts
+        # (reload swaps the clip, not the frame), so they are only redone
+        # if the frame was lost or the switch to audio failed.
+        challenge_frame = None
+        audio_mode = False
+        
         for attempt in range(self.max_attempts):
             try:
                 logger.info(f"Audio solve attempt {attempt + 1}/{self.max_attempts}")
                 
                 # Get challenge frame
-                challenge_frame = await self._get_challenge_frame(page)
-                if not challenge_frame:
-                    logger.error("Could not find challenge frame")
-                    continue
+                if challenge_frame is None or challenge_frame.is_detached():
+                    challenge_frame = await self._get_challenge_frame(page)
+                    audio_mode = False
+                    if not challenge_frame:
+                        logger.error("Could not find challenge frame")
+                        continue
                 
-                # Click audio button
-                clicked = await self._click_audio_button(challenge_frame)
-                if not clicked:
-                    logger.warning("Could not click audio button")
-                    continue
+                if not audio_mode:
+                    # Click audio button
+                    clicked = await self._click_audio_button(challenge_frame)
+                    if not clicked:
+                        logger.warning("Could not click audio button")
+                        continue
+                    audio_mode = True
+                    
+                    # Wait for the audio challenge (or the rate-limit notice) to render
+                    await self._wait_quietly(challenge_frame.wait_for_selector(
+                        "#audio-source, .rc-doscaptcha-header-text",
+                        state="attached",
+                        timeout=5000,
+                    ))
                 
-                await page.wait_for_timeout(1000)
+                # Rate-limit check + audio URL in one round trip
+                state = await self._read_audio_state(challenge_frame)
                 
                 # Check for rate limit - raise exception for immediate fallback
-                if await self._check_rate_limit(challenge_frame):
+                if state.get("rateLimited"):
                     logger.warning("Rate limited - raising AudioRateLimitError for YOLO fallback")
                     raise AudioRateLimitError("reCAPTCHA audio rate limited")
                 
                 # Get audio URL
-                audio_url = await self._get_audio_url(challenge_frame)
+                audio_url = state.get("audioUrl")
                 if not audio_url:
                     logger.warning("Could not get audio URL")
                     continue
                 
-                # Download audio
-                audio_path = await self._download_audio(audio_url)
-                if not audio_path:
+                # Download audio (kept in memory)
+                audio_bytes = await self._download_audio(audio_url)
+                if not audio_bytes:
                     logger.warning("Could not download audio")
                     continue
                 
-                try:
-                    # Transcribe audio
-                    transcription = await self._transcribe_audio(audio_path)
-                    if not transcription:
-                        logger.warning("Could not transcribe audio")
-                        # Try new audio
-                        await self._click_reload_button(challenge_frame)
-                        await page.wait_for_timeout(1000)
-                        continue
-                    
-                    logger.info(f"Transcription: {transcription}")
-                    
-                    # Submit answer
-                    submitted = await self._submit_answer(challenge_frame, transcription)
-                    if not submitted:
-                        logger.warning("Could not submit answer")
-                        continue
-                    
-                    await page.wait_for_timeout(2000)
-                    
-                    # Check if solved
-                    if await self._check_solved(page):
-                        logger.info("Audio challenge solved!")
-                        return {"success": True}
-                    
-                    # Wrong answer, try again with new audio
-                    logger.info("Wrong answer, trying new audio")
-                    await self._click_reload_button(challenge_frame)
-                    await page.wait_for_timeout(1000)
-                    
-                finally:
-                    # Cleanup temp file
-                    if audio_path and os.path.exists(audio_path):
-                        os.remove(audio_path)
+                # Transcribe audio
+                transcription = await self._transcribe_audio(audio_bytes)
+                if not transcription:
+                    logger.warning("Could not transcribe audio")
+                    # Try new audio
+                    await self._reload_audio(challenge_frame, audio_url)
+                    continue
+                
+                logger.info(f"Transcription: {transcription}")
+                
+                # Submit answer
+                submitted = await self._submit_answer(challenge_frame, transcription)
+                if not submitted:
+                    logger.warning("Could not submit answer")
+                    continue
+                
+                await self._wait_for_verdict(page, challenge_frame)
+                
+                # Check if solved
+                if await self._check_solved(page):
+                    logger.info("Audio challenge solved!")
+                    return {"success": True}
+                
+                # Wrong answer, try again with new audio
+                logger.info("Wrong answer, trying new audio")
+                await self._reload_audio(challenge_frame, audio_url)
                 
             except Exception as e:
                 logger.error(f"Audio solve attempt {attempt + 1} error: {e}")
@@ -136,79 +610,43 @@ class AudioSolver:
     
     async def _get_challenge_frame(self, page):
         """Get the challenge iframe content frame"""
-        selectors = [
-            "iframe[src*='recaptcha'][src*='bframe']",
-            "iframe[src*='google.com/recaptcha/api2/bframe']",
-            "iframe[src*='google.com/recaptcha/enterprise/bframe']",
-        ]
-        
-        for selector in selectors:
-            try:
-                iframe = await page.query_selector(selector)
-                if iframe:
-                    frame = await iframe.content_frame()
-                    if frame:
-                        return frame
-            except Exception:
-                continue
+        try:
+            # One selector list = one lookup instead of one per variant
+            iframe = await page.query_selector(CHALLENGE_IFRAME_SELECTOR)
+            if iframe:
+                return await iframe.content_frame()
+        except Exception:
+            pass
         
         return None
     
     async def _click_audio_button(self, frame) -> bool:
         """Click the audio challenge button"""
         try:
-            # Find audio button
             audio_button = await frame.query_selector("#recaptcha-audio-button")
             if audio_button:
                 await audio_button.click()
                 return True
             
-            # Alternative selector
-            audio_button = await frame.query_selector('button[id="recaptcha-audio-button"]')
-            if audio_button:
-                await audio_button.click()
-                return True
-            
             return False
         except Exception as e:
             logger.error(f"Error clicking audio button: {e}")
             return False
     
-    async def _check_rate_limit(self, frame) -> bool:
-        """Check if rate limited"""
-        try:
-            error_element = await frame.query_selector(".rc-doscaptcha-header-text")
-            if error_element:
-                text = await error_element.text_content()
-                if "try again later" in text.lower():
-                    return True
-            return False
-        except Exception:
-            return False
-    
-    async def _get_audio_url(self, frame) -> Optional[str]:
-        """Get the audio challenge URL"""
+    async def _read_audio_state(self, frame) -> Dict[str, Any]:
+        """
+        Read rate-limit state and audio URL in a single evaluate.
+        
+        Returns:
+            dict with 'rateLimited' (bool) and 'audioUrl' (str or None)
+        """
         try:
-            # Method 1: Get from audio element
-            audio_source = await frame.query_selector("#audio-source")
-            if audio_source:
-                src = await audio_source.get_attribute("src")
-                if src:
-                    return src
-            
-            # Method 2: Get from download link
-            download_link = await frame.query_selector(".rc-audiochallenge-tdownload-link")
-            if download_link:
-                href = await download_link.get_attribute("href")
-                if href:
-                    return href
-            
-            return None
+            return await frame.evaluate(_AUDIO_STATE_SCRIPT)
         except Exception as e:
-            logger.error(f"Error getting audio URL: {e}")
-            return None
+            logger.error(f"Error reading audio challenge state: {e}")
+            return {}
     
-    async def _download_audio(self, url: str, user_agent: Optional[str] = None) -> Optional[str]:
+    async def _download_audio(self, url: str, user_agent: Optional[str] = None) -> Optional[bytes]:
         """
         Download audio file with stealth headers.
         
@@ -217,7 +655,7 @@ class AudioSolver:
             user_agent: Browser User-Agent to match fingerprint
         
         Returns:
-            Path to downloaded temp file or None
+            Audio file bytes or None
         """
         try:
             # Stealth headers to match browser fingerprint
@@ -237,95 +675,107 @@ class AudioSolver:
                 "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             )
             
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        # Save to temp file
-                        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-                            f.write(await response.read())
-                            return f.name
+            # Shared pooled session: keep-alive connections to google.com are
+            # reused across attempts and concurrent solves
+            session = await get_http_session()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 200:
+                    return await response.read()
             return None
         except Exception as e:
             logger.error(f"Error downloading audio: {e}")
             return None
     
-    def _clean_audio(self, audio_path: str) -> str:
+    def _clean_audio(self, audio_bytes: bytes) -> Tuple[np.ndarray, float]:
         """
-        Clean audio for better Whisper transcription.
+        Decode and clean audio for better Whisper transcription.
+        
+        Decodes once to 16 kHz mono float32 and works on the samples in
+        memory - no re-encode, no temp files.
         
         Operations:
         1. Normalize volume to -20 dBFS
-        2. Remove leading/trailing silence
-        3. Apply slight noise reduction via low-pass filter
+        2. Remove silences (>= 1s, keeping 100ms padding)
+        3. Apply slight noise reduction via 4kHz low-pass filter
         
         Args:
-            audio_path: Path to raw audio file
+            audio_bytes: Downloaded audio file
         
         Returns:
-            Path to cleaned audio file
+            (cleaned samples, accepted directly by Whisper - or the decoded
+            samples unchanged if cleaning failed; voiced ratio of the
+            normalized clip, measured before silences are stripped)
         """
+        samples = _decode_audio(audio_bytes)
+        if samples.size == 0:
+            return samples, 0.0
+        
         try:
-            from pydub import AudioSegment
-            from pydub.silence import strip_silence
+            cleaned = samples.copy()
             
-            # Load audio
-            audio = AudioSegment.from_mp3(audio_path)
+            # Normalize volume to the target dBFS
+            rms = float(np.sqrt(np.mean(cleaned * cleaned)))
+            if rms > 0:
+                cleaned *= 10.0 ** ((CLEAN_TARGET_DBFS - 20.0 * np.log10(rms)) / 20.0)
             
-            # Normalize volume to -20 dBFS (good level for speech)
-            target_dBFS = -20.0
-            change_in_dBFS = target_dBFS - audio.dBFS
-            audio = audio.apply_gain(change_in_dBFS)
+            # VAD input: after stripping, nearly every frame would be voiced
+            voiced = _voiced_ratio(cleaned)
             
-            # Remove leading/trailing silence
-            # silence_thresh: audio below this is considered silence
-            # min_silence_len: minimum length of silence to strip (ms)
-            audio = strip_silence(
-                audio,
-                silence_thresh=-40,  # dBFS threshold
-                padding=100  # Keep 100ms padding
-            )
+            cleaned = _strip_silence(cleaned)
+            cleaned = _low_pass(cleaned, CLEAN_LOWPASS_HZ)
             
-            # Low-pass filter to reduce high-frequency noise
-            # reCAPTCHA audio is speech, mostly below 4kHz
-            audio = audio.low_pass_filter(4000)
-            
-            # Export cleaned audio
-            cleaned_path = audio_path.replace(".mp3", "_cleaned.mp3")
-            audio.export(cleaned_path, format="mp3")
-            
-            logger.debug(f"Audio cleaned: {audio_path} -> {cleaned_path}")
-            return cleaned_path
+            logger.debug("Audio cleaned: %d -> %d samples", samples.size, cleaned.size)
+            return np.clip(cleaned, -1.0, 1.0, out=cleaned), voiced
             
         except Exception as e:
-            logger.warning(f"Audio cleaning failed, using original: {e}")
-            return audio_path
+            logger.warning("Audio cleaning failed, using original: %s", e)
+            return samples, _voiced_ratio(samples)
     
-    async def _transcribe_audio(self, audio_path: str) -> Optional[str]:
-        """Transcribe audio using configured engine"""
+    async def _transcribe_audio(self, audio_bytes: bytes) -> Optional[str]:
+        """
+        Transcribe audio using configured engine.
+        
+        Results are memoized by content hash (see _TRANSCRIPT_CACHE).
+        """
+        cache_key = f"{self.engine}:{hashlib.sha256(audio_bytes).hexdigest()}"
+        cached = _TRANSCRIPT_CACHE.get(cache_key)
+        if cached is not None:
+            _TRANSCRIPT_CACHE.move_to_end(cache_key)
+            logger.debug("Transcription cache hit")
+            return cached or None
+        
         try:
             if self.engine == "whisper":
-                return await self._transcribe_whisper(audio_path)
+                text = await self._transcribe_whisper(audio_bytes)
             elif self.engine == "google":
-                return await self._transcribe_google(audio_path)
+                text = await self._transcribe_google(audio_bytes)
             elif self.engine == "azure":
-                return await self._transcribe_azure(audio_path)
+                text = await self._transcribe_azure(audio_bytes)
             else:
                 # Default to whisper
-                return await self._transcribe_whisper(audio_path)
+                text = await self._transcribe_whisper(audio_bytes)
         except Exception as e:
             logger.error(f"Transcription error: {e}")
             return None
+        
+        # None = engine error (not cached); "" = no speech (cached)
+        if text is not None:
+            _TRANSCRIPT_CACHE[cache_key] = text
+            if len(_TRANSCRIPT_CACHE) > TRANSCRIPT_CACHE_MAX_SIZE:
+                _TRANSCRIPT_CACHE.popitem(last=False)
+        return text or None
     
-    async def _transcribe_whisper(self, audio_path: str) -> Optional[str]:
+    async def _transcribe_whisper(self, audio_bytes: bytes) -> Optional[str]:
         """
         Transcribe using local Whisper model with reCAPTCHA-tuned settings.
         
         Uses GLOBAL SINGLETON - model loaded once at startup.
+        Returns "" when no speech was recognized, None on error.
         
         Optimizations:
         - Medium model for better accuracy (fits 24GB RAM)
         - initial_prompt tuned for digit/letter sequences
-        - Clean audio before transcription (pydub normalization)
+        - Clean audio before transcription (in-memory NumPy DSP)
         """
         try:
             # Get global singleton model (loaded at startup)
@@ -336,83 +786,71 @@ class AudioSolver:
                 logger.warning("Whisper model not pre-loaded, loading now...")
                 model = await get_whisper_model_async()
             
-            # Clean audio before transcription (normalize + strip silence)
-            cleaned_path = self._clean_audio(audio_path)
+            loop = asyncio.get_running_loop()
             
-            try:
-                # Initial prompt tuned for reCAPTCHA audio challenges
-                # Primes Whisper to expect digits and letters
-                initial_prompt = (
-                    "The audio contains spoken digits and letters. "
-                    "Examples: 7 3 9 2 5, a b c d e, 4 8 1 6 0, "
-                    "m n p q r, 2 4 6 8 0."
-                )
-                
+            # Decode + clean before transcription (in-memory samples, no temp file).
+            # ffmpeg decode + DSP is CPU work - keep it off the event loop.
+            cleaned, voiced = await loop.run_in_executor(None, self._clean_audio, audio_bytes)
+            
+            # Energy VAD: near-silent clips go straight to a reload
+            if voiced < VAD_MIN_VOICED_RATIO:
+                logger.info("Low-voice audio (%.0f%% voiced), skipping transcription", voiced * 100)
+                return ""
+            
+            if _is_faster_whisper(model):
                 # Run transcription in thread pool to not block event loop
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: model.transcribe(
-                        cleaned_path,
-                        language="en",
-                        fp16=False,  # CPU mode
-                        initial_prompt=initial_prompt,
-                        temperature=0.0,  # Deterministic output
-                        compression_ratio_threshold=2.4,
-                        logprob_threshold=-1.0,
-                        no_speech_threshold=0.6,
-                    )
-                )
-                
-                text = result.get("text", "").strip()
-                
-                # Post-process: remove extra spaces, lowercase
-                text = " ".join(text.split()).lower()
-                
-                return text if text else None
-                
-            finally:
-                # Cleanup cleaned audio if different from original
-                if cleaned_path != audio_path and os.path.exists(cleaned_path):
-                    os.remove(cleaned_path)
+                text = await loop.run_in_executor(None, _run_whisper, model, cleaned)
+            else:
+                # Batched with other in-flight solves (one encoder pass)
+                text = await _whisper_batcher.submit(model, cleaned)
+            text = text.strip()
+            
+            # Post-process: remove extra spaces, lowercase
+            text = " ".join(text.split()).lower()
+            
+            # Too short or a known hallucination: treat as no speech
+            if len(text) < MIN_TRANSCRIPT_CHARS or text.strip(" .!?,") in WHISPER_HALLUCINATIONS:
+                logger.info("Discarding implausible transcription: %r", text)
+                return ""
+            
+            return text
             
         except Exception as e:
             logger.error(f"Whisper transcription error: {e}")
             return None
     
-    async def _transcribe_google(self, audio_path: str) -> Optional[str]:
+    async def _transcribe_google(self, audio_bytes: bytes) -> Optional[str]:
         """Transcribe using Google Speech Recognition"""
         try:
-            import speech_recognition as sr
-            from pydub import AudioSegment
-            
-            # Convert MP3 to WAV
-            audio = AudioSegment.from_mp3(audio_path)
-            wav_path = audio_path.replace(".mp3", ".wav")
-            audio.export(wav_path, format="wav")
-            
-            try:
-                # Recognize
-                recognizer = sr.Recognizer()
-                with sr.AudioFile(wav_path) as source:
-                    audio_data = recognizer.record(source)
-                    text = recognizer.recognize_google(audio_data)  # type: ignore
-                    return text
-            finally:
-                if os.path.exists(wav_path):
-                    os.remove(wav_path)
-                    
+            # MP3 decode + blocking HTTP call - run in thread pool
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._recognize_google_sync, audio_bytes)
         except Exception as e:
             logger.error(f"Google transcription error: {e}")
             return None
     
-    async def _transcribe_azure(self, audio_path: str) -> Optional[str]:
+    @staticmethod
+    def _recognize_google_sync(audio_bytes: bytes) -> Optional[str]:
+        """Blocking part of _transcribe_google (runs in a worker thread)."""
+        import speech_recognition as sr
+        
+        # Same single ffmpeg decode as Whisper, handed over as 16-bit PCM
+        # (no WAV re-encode)
+        samples = _decode_audio(audio_bytes)
+        pcm16 = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+        audio_data = sr.AudioData(pcm16, WHISPER_SAMPLE_RATE, 2)
+        
+        # Recognize
+        recognizer = sr.Recognizer()
+        return recognizer.recognize_google(audio_data)  # type: ignore
+    
+    async def _transcribe_azure(self, audio_bytes: bytes) -> Optional[str]:
         """Transcribe using Azure Speech Services"""
         try:
             # Azure SDK would be imported here
             # For now, fallback to Whisper
             logger.warning("Azure not configured, falling back to Whisper")
-            return await self._transcribe_whisper(audio_path)
+            return await self._transcribe_whisper(audio_bytes)
         except Exception as e:
             logger.error(f"Azure transcription error: {e}")
             return None
@@ -451,32 +889,55 @@ class AudioSolver:
         except Exception:
             return False
     
+    async def _reload_audio(self, frame, old_url: str) -> None:
+        """Request new audio and wait until its URL replaces old_url"""
+        if await self._click_reload_button(frame):
+            await self._wait_quietly(frame.wait_for_function(
+                _AUDIO_CHANGED_SCRIPT, arg=old_url, timeout=5000,
+            ))
+    
+    async def _wait_for_verdict(self, page, frame) -> None:
+        """
+        Wait until reCAPTCHA reacts to a submitted answer.
+        
+        The checkbox lives in the (cross-origin) anchor frame and the
+        error message in the challenge frame, so both are watched and
+        whichever appears first ends the wait.
+        """
+        waits = [asyncio.ensure_future(frame.wait_for_function(
+            _AUDIO_ERROR_SCRIPT, timeout=8000,
+        ))]
+        try:
+            iframe = await page.query_selector(ANCHOR_IFRAME_SELECTOR)
+            anchor = await iframe.content_frame() if iframe else None
+            if anchor:
+                waits.append(asyncio.ensure_future(anchor.wait_for_selector(
+                    "#recaptcha-anchor.recaptcha-checkbox-checked",
+                    state="attached",
+                    timeout=8000,
+                )))
+        except Exception:
+            pass
+        
+        done, pending = await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in pending:
+            waiter.cancel()
+        for waiter in done:
+            waiter.exception()  # Timeout is fine - _check_solved decides
+    
+    @staticmethod
+    async def _wait_quietly(waiter) -> None:
+        """Await a Playwright wait; a timeout just means "proceed anyway"."""
+        try:
+            await waiter
+        except Exception as e:
+            logger.debug("Wait ended without match: %s", e)
+    
     async def _check_solved(self, page) -> bool:
         """Check if the captcha was solved"""
         try:
-            # Check for checkbox checked state
-            iframe_selectors = [
-                "iframe[src*='recaptcha'][src*='anchor']",
-                "iframe[src*='google.com/recaptcha/api2/anchor']",
-            ]
-            
-            for selector in iframe_selectors:
-                try:
-                    iframe = await page.query_selector(selector)
-                    if iframe:
-                        frame = await iframe.content_frame()
-                        if frame:
-                            is_checked = await frame.evaluate('''
-                                () => {
-                                    const anchor = document.querySelector('#recaptcha-anchor');
-                                    return anchor && anchor.classList.contains('recaptcha-checkbox-checked');
-                                }
-                            ''')
-                            if is_checked:
-                                return True
-                except Exception:
-                    continue
-            
-            return False
+            iframe = await page.query_selector(ANCHOR_IFRAME_SELECTOR)
+            frame = await iframe.content_frame() if iframe else None
+            return bool(frame and await frame.evaluate(IS_CHECKED_SCRIPT))
         except Exception:
             return False
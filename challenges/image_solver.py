@@ -29,18 +29,27 @@ model = get_yolo_model()  # Returns cached instance, no disk I/O
 """
 
 import os
+import re
 import logging
 import tempfile
 import base64
 import asyncio
-import aiohttp
 import uuid
+import random
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Any, Optional, List, Tuple
+from contextlib import suppress
+from typing import Dict, Any, Optional, List, Set, Tuple
 from pathlib import Path
-from PIL import Image
-import io
+
+import numpy as np
+
+from ..utils.http import get_http_session
+from ..utils.recaptcha_dom import (
+    ANCHOR_IFRAME_SELECTOR,
+    CHALLENGE_IFRAME_SELECTOR,
+    IS_CHECKED_SCRIPT,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,8 +58,22 @@ logger = logging.getLogger(__name__)
 # ACTIVE LEARNING DATA COLLECTION
 # =============================================================================
 
-# Thread pool for non-blocking image saving
-_image_save_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="img_saver")
+# Thread pool for non-blocking image saving (created on first save,
+# sized by solver.image.save_pool_size / IMG_SAVE_POOL_SIZE)
+_image_save_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_save_executor() -> ThreadPoolExecutor:
+    """Get the image-save thread pool, creating it on first use."""
+    global _image_save_executor
+    
+    if _image_save_executor is None:
+        from ..core.config import get_config
+        _image_save_executor = ThreadPoolExecutor(
+            max_workers=max(1, get_config().solver.image.save_pool_size),
+            thread_name_prefix="img_saver",
+        )
+    return _image_save_executor
 
 # Base paths for data collection
 DATA_COLLECTION_BASE = Path(__file__).parent.parent / "data" / "training_collection"
@@ -68,6 +91,24 @@ UNIQUE_CLASSES = {
 }
 
 
+# Directories already known to exist (class dirs + failed_cases). Reached
+# from the event loop and from load_yolo_model in an executor thread, so
+# fills go through a lock.
+_ensured_dirs: Set[Path] = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def _ensure_dir(path: Path):
+    """mkdir -p once per directory per process"""
+    if path in _ensured_dirs:
+        return
+    with _ensured_dirs_lock:
+        if path in _ensured_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
 def _ensure_collection_directories():
     """
     Create all necessary directories for data collection.
@@ -75,15 +116,14 @@ def _ensure_collection_directories():
     """
     try:
         # Create base directory
-        DATA_COLLECTION_BASE.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(DATA_COLLECTION_BASE)
         
         # Create class subdirectories
         for class_name in UNIQUE_CLASSES:
-            class_dir = DATA_COLLECTION_BASE / class_name
-            class_dir.mkdir(exist_ok=True)
+            _ensure_dir(DATA_COLLECTION_BASE / class_name)
         
         # Create failed_cases directory
-        FAILED_CASES_DIR.mkdir(exist_ok=True)
+        _ensure_dir(FAILED_CASES_DIR)
         
         logger.info(f"Active Learning directories initialized at: {DATA_COLLECTION_BASE}")
     except Exception as e:
@@ -93,18 +133,68 @@ def _ensure_collection_directories():
 def _save_image_sync(image_bytes: bytes, save_path: Path):
     """
     Synchronous image save (runs in thread pool).
+    
+    Raw fd writes hand the bytes straight to the kernel (no buffered
+    file object copy).
     """
     try:
-        with open(save_path, "wb") as f:
-            f.write(image_bytes)
+        fd = os.open(save_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(image_bytes)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
     except Exception as e:
         logger.debug(f"Failed to save image to {save_path}: {e}")
 
 
+# Pending (image_bytes, path) writes. Bounded: active-learning data is
+# best-effort, so a full queue drops tiles instead of growing memory.
+SAVE_QUEUE_MAX_SIZE = 1024
+
+_save_queue: Optional[asyncio.Queue] = None
+_save_writer: Optional[asyncio.Task] = None
+
+
+async def _save_writer_loop():
+    """Drain the save queue, writing each burst on the save thread pool."""
+    assert _save_queue is not None
+    loop = asyncio.get_running_loop()
+    
+    while True:
+        batch = [await _save_queue.get()]
+        while not _save_queue.empty():
+            batch.append(_save_queue.get_nowait())
+        
+        executor = _get_save_executor()
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, _save_image_sync, image_bytes, save_path)
+              for image_bytes, save_path in batch),
+            return_exceptions=True,
+        )
+
+
+def _queue_save(image_bytes: bytes, save_path: Path) -> bool:
+    """Queue one image write (call from the event loop). False if dropped."""
+    global _save_queue, _save_writer
+    
+    if _save_writer is None:
+        _save_queue = asyncio.Queue(maxsize=SAVE_QUEUE_MAX_SIZE)
+        _save_writer = asyncio.create_task(_save_writer_loop())
+    
+    try:
+        _save_queue.put_nowait((image_bytes, save_path))
+        return True
+    except asyncio.QueueFull:
+        logger.debug(f"Save queue full, dropping {save_path.name}")
+        return False
+
+
 def save_uncertain_tile(image_bytes: bytes, class_name: str, confidence: float):
     """
     Save a tile with uncertain prediction for Active Learning.
-    Non-blocking - submits to thread pool.
+    Non-blocking - queued for the background writer.
     
     Args:
         image_bytes: Raw image bytes
@@ -113,16 +203,15 @@ def save_uncertain_tile(image_bytes: bytes, class_name: str, confidence: float):
     """
     try:
         class_dir = DATA_COLLECTION_BASE / class_name
-        if not class_dir.exists():
-            class_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(class_dir)
         
         # Generate unique filename with confidence score
         filename = f"{uuid.uuid4().hex[:12]}_conf{confidence:.2f}.jpg"
         save_path = class_dir / filename
         
-        # Submit to thread pool (non-blocking)
-        _image_save_executor.submit(_save_image_sync, image_bytes, save_path)
-        logger.debug(f"Queued uncertain tile for saving: {class_name} (conf={confidence:.2f})")
+        # Queue for the writer (non-blocking)
+        if _queue_save(image_bytes, save_path):
+            logger.debug(f"Queued uncertain tile for saving: {class_name} (conf={confidence:.2f})")
     except Exception as e:
         logger.debug(f"Error queueing uncertain tile: {e}")
 
@@ -130,7 +219,7 @@ def save_uncertain_tile(image_bytes: bytes, class_name: str, confidence: float):
 def save_failed_case_tiles(tiles: List[Tuple[int, bytes]], challenge_type: str):
     """
     Save all tiles from a failed solve attempt.
-    Non-blocking - submits to thread pool.
+    Non-blocking - queued for the background writer.
     
     Args:
         tiles: List of (index, image_bytes) tuples
@@ -141,13 +230,13 @@ def save_failed_case_tiles(tiles: List[Tuple[int, bytes]], challenge_type: str):
         case_id = uuid.uuid4().hex[:8]
         safe_challenge = challenge_type.replace(" ", "_").replace("/", "_")[:30]
         case_dir = FAILED_CASES_DIR / f"{safe_challenge}_{case_id}"
-        case_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(FAILED_CASES_DIR)
+        case_dir.mkdir()  # Unique per case - not worth caching
         
-        # Submit each tile to thread pool
+        # Queue each tile for the writer
         for idx, image_bytes in tiles:
             filename = f"tile_{idx:02d}.jpg"
-            save_path = case_dir / filename
-            _image_save_executor.submit(_save_image_sync, image_bytes, save_path)
+            _queue_save(image_bytes, case_dir / filename)
         
         logger.info(f"Queued {len(tiles)} tiles from failed case to: {case_dir.name}")
     except Exception as e:
@@ -162,6 +251,327 @@ def save_failed_case_tiles(tiles: List[Tuple[int, bytes]], challenge_type: str):
 _yolo_model = None
 _yolo_model_lock = asyncio.Lock()
 
+# device / half passed to every predict() (set by load_yolo_model)
+_yolo_predict_kwargs: Dict[str, Any] = {}
+
+# Optional extra tiers (solver.image.tier_models), e.g. a nano model for
+# easy classes. Tiers that aren't configured fall back to _yolo_model.
+_yolo_tier_models: Dict[str, Any] = {}
+
+# Tile decode + inference run here, off the event loop. Jobs come from
+# the YoloBatcher one batch at a time, so one thread suffices. Ultralytics
+# predictors are not thread-safe on a shared model, so predict() itself
+# is also serialized.
+_yolo_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yolo")
+_yolo_predict_lock = threading.Lock()
+
+
+def _yolo_device() -> str:
+    """"cuda:0" when a GPU is visible, else "cpu"."""
+    try:
+        import torch
+        return "cuda:0" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        return "cpu"
+
+
+# Square model input; tiles are resized straight to it
+YOLO_INPUT_SIZE = 640
+
+# Startup warm-up: one shape per grid size (3x3, 4x4), a few passes each
+YOLO_WARMUP_BATCH_SIZES = (9, 16)
+YOLO_WARMUP_PASSES = 3
+
+# torch.compile'd models build one graph (and CUDA graph) per input shape,
+# so their batches are zero-padded up to one of these sizes - all built
+# during warm-up - instead of hitting a recompile on the request path.
+# The last size must be YOLO_MAX_BATCH_TILES.
+YOLO_COMPILED_BATCH_SIZES = (1, 4, 9, 16, 32, 64)
+
+# id() of models whose forward is compiled (see _compile_yolo_model)
+_yolo_compiled_models: Set[int] = set()
+
+
+def _decode_tile(image_bytes: bytes, size: int = YOLO_INPUT_SIZE) -> np.ndarray:
+    """
+    Decode a tile to a (size, size, 3) RGB uint8 array.
+    
+    OpenCV (libjpeg-turbo, SIMD resize) instead of PIL. Tiles are square,
+    so a plain resize equals Ultralytics' letterbox.
+    """
+    import cv2
+    
+    img = cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError("undecodable image")
+    img = cv2.resize(img, (size, size), interpolation=cv2.INTER_LINEAR)
+    return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+
+
+def _predict_tiles(model, groups: List[List[Tuple[int, bytes]]], conf: float):
+    """
+    Blocking decode + one batched predict (runs in a worker thread).
+    
+    Tiles from every group (one group per challenge) go to the model as a
+    single (B, 3, H, W) tensor, skipping Ultralytics' per-image
+    preprocessing (tensor inputs are RGB in [0, 1]).
+    
+    Returns:
+        [(decoded tiles, results)] per group - tiles that failed to
+        decode are dropped
+    """
+    import torch
+    
+    arrays = []
+    decoded_groups = []
+    for tiles in groups:
+        decoded = []
+        for idx, image_bytes in tiles:
+            try:
+                arrays.append(_decode_tile(image_bytes))
+                decoded.append((idx, image_bytes))
+            except Exception as e:
+                logger.debug(f"Error decoding tile {idx}: {e}")
+        decoded_groups.append(decoded)
+    
+    if not arrays:
+        return [([], []) for _ in groups]
+    
+    batch = torch.from_numpy(np.stack(arrays)).permute(0, 3, 1, 2).float().div_(255.0)
+    if id(model) in _yolo_compiled_models:
+        padded = next(size for size in YOLO_COMPILED_BATCH_SIZES if size >= len(arrays))
+        if padded > len(arrays):
+            batch = torch.cat([batch, batch.new_zeros(padded - len(arrays), *batch.shape[1:])])
+    with _yolo_predict_lock:
+        results = model.predict(
+            batch,
+            conf=conf,
+            verbose=False,
+            **_yolo_predict_kwargs
+        )[:len(arrays)]  # drop padding
+    
+    # Split the flat results back per group
+    output = []
+    offset = 0
+    for decoded in decoded_groups:
+        output.append((decoded, results[offset:offset + len(decoded)]))
+        offset += len(decoded)
+    return output
+
+
+# =============================================================================
+# YOLO MICRO-BATCHER
+# =============================================================================
+# Concurrent image challenges would otherwise each run their own forward
+# pass. Tile sets are queued; the batcher waits up to YOLO_BATCH_WAIT for
+# more, then classifies up to YOLO_MAX_BATCH_TILES tiles in one pass.
+
+YOLO_MAX_BATCH_TILES = 64
+YOLO_BATCH_WAIT = 0.01  # seconds
+
+
+class YoloBatcher:
+    """Coalesces concurrent tile classifications into batched predicts."""
+    
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def submit(self, model, tiles: List[Tuple[int, bytes]], conf: float):
+        """Queue one challenge's tiles and wait for (decoded tiles, results)."""
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(model, conf))
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((tiles, future))
+        return await future
+    
+    async def _run(self, model, conf: float):
+        # conf is solver.image.confidence_threshold, identical for every caller
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        held = None  # challenge that didn't fit the last batch
+        
+        while True:
+            batch = [held if held is not None else await self._queue.get()]
+            held = None
+            size = len(batch[0][0])
+            deadline = loop.time() + YOLO_BATCH_WAIT
+            while size < YOLO_MAX_BATCH_TILES:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if size + len(item[0]) > YOLO_MAX_BATCH_TILES:
+                    # Never exceed the cap (the exported engine's max batch);
+                    # this challenge opens the next batch instead
+                    held = item
+                    break
+                batch.append(item)
+                size += len(item[0])
+            
+            try:
+                outputs = await loop.run_in_executor(
+                    _yolo_executor, _predict_tiles, model, [tiles for tiles, _ in batch], conf
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            logger.debug(f"YOLO batch classified: {size} tile(s) from {len(batch)} challenge(s)")
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
+
+
+# One batcher per loaded model (tiers never share a forward pass)
+_yolo_batchers: Dict[int, YoloBatcher] = {}
+
+
+def _get_yolo_batcher(model) -> YoloBatcher:
+    """Batcher for a model (models live for the whole process, so id() is stable)"""
+    batcher = _yolo_batchers.get(id(model))
+    if batcher is None:
+        batcher = _yolo_batchers[id(model)] = YoloBatcher()
+    return batcher
+
+
+def _target_class_ids(model, target_class: str) -> np.ndarray:
+    """Model class IDs matching a target class, for a vectorized isin()"""
+    target_lower = target_class.lower()
+    target_spaced = target_lower.replace("_", " ")
+    return np.array([
+        class_id for class_id, class_name in model.names.items()
+        if class_name.lower() == target_lower or target_spaced in class_name.lower()
+    ], dtype=np.int64)
+
+
+# Model tier per target class. Easy, large objects are fine on a nano
+# model; small or ambiguous ones (crosswalk stripes, hydrants, traffic
+# lights) stay on the full-size model.
+YOLO_TIER_NANO = "nano"
+YOLO_TIER_SMALL = "small"
+YOLO_TIER_MEDIUM = "medium"
+YOLO_DEFAULT_TIER = YOLO_TIER_SMALL
+
+_TIER_BY_CLASS = {
+    "car": YOLO_TIER_NANO,
+    "bus": YOLO_TIER_NANO,
+    "boat": YOLO_TIER_NANO,
+    "bridge": YOLO_TIER_NANO,
+    "tractor": YOLO_TIER_SMALL,
+    "bicycle": YOLO_TIER_SMALL,
+    "motorcycle": YOLO_TIER_SMALL,
+    "chimney": YOLO_TIER_SMALL,
+    "stairs": YOLO_TIER_SMALL,
+    "crosswalk": YOLO_TIER_MEDIUM,
+    "fire_hydrant": YOLO_TIER_MEDIUM,
+    "traffic_light": YOLO_TIER_MEDIUM,
+}
+
+
+# Where Ultralytics writes each export format, relative to the .pt file
+_EXPORT_SUFFIXES = {
+    "onnx": ".onnx",
+    "engine": ".engine",
+    "openvino": "_openvino_model",
+}
+
+
+def _exported_model_path(pt_path: Path, export_format: str, half: bool, int8: bool) -> Path:
+    """
+    Return the exported model for pt_path, exporting it on first use.
+    
+    The export is written next to the .pt file and reused on later starts;
+    delete it to re-export after retraining.
+    """
+    from ultralytics import YOLO  # type: ignore
+    
+    suffix = _EXPORT_SUFFIXES[export_format]
+    if suffix.startswith("."):
+        export_path = pt_path.with_suffix(suffix)
+    else:
+        export_path = pt_path.with_name(pt_path.stem + suffix)
+    
+    if not export_path.exists():
+        logger.info(f"Exporting YOLO model to {export_format} (one-time)...")
+        # Fixed 640x640 input (what _predict_tiles feeds); dynamic batch up
+        # to YOLO_MAX_BATCH_TILES, the most YoloBatcher ever sends at once
+        export_path = Path(YOLO(str(pt_path)).export(
+            format=export_format,
+            imgsz=YOLO_INPUT_SIZE,
+            dynamic=True,
+            batch=YOLO_MAX_BATCH_TILES,
+            half=half and not int8,
+            int8=int8,
+        ))
+    
+    return export_path
+
+
+def _compile_yolo_model(model, device: str) -> None:
+    """
+    Fold Conv+BN and torch.compile the network's forward.
+    
+    forward is replaced on the module itself (not wrapped) because the
+    Ultralytics predictor calls model.fuse() / .to() / .half(), which
+    return the bare module and would drop a wrapper. Shapes are static:
+    _predict_tiles pads batches to YOLO_COMPILED_BATCH_SIZES, and warm-up
+    builds a graph for each.
+    """
+    import torch
+    
+    network = model.model
+    network.fuse(verbose=False)
+    network.forward = torch.compile(
+        network.forward,
+        mode="reduce-overhead" if device != "cpu" else "default",  # CUDA graphs on GPU
+        dynamic=False,
+    )
+    _yolo_compiled_models.add(id(model))
+
+
+def _load_warm_yolo(path: Path, export_format: str, image_config):
+    """
+    Load one YOLO model at the serving device/precision and warm it up.
+    
+    With export_format set, the weights are swapped for their export
+    (exported on first use).
+    """
+    from ultralytics import YOLO  # type: ignore
+    import torch
+    
+    if export_format:
+        path = _exported_model_path(
+            path, export_format, _yolo_predict_kwargs["half"], image_config.export_int8
+        )
+    logger.info(f"Loading YOLO model from {path}")
+    model = YOLO(str(path))
+    
+    # Exports are already fused/optimized graphs; compile only the .pt path
+    if image_config.torch_compile and not export_format:
+        logger.info("Compiling YOLO model (one-time, finishes during warm-up)...")
+        _compile_yolo_model(model, _yolo_predict_kwargs["device"])
+    
+    # Warm up with the exact inputs solves use - (B, 3, 640, 640) tensors
+    # for 3x3 and 4x4 grids (every padded size if compiled), at the serving
+    # device/precision - so weights are resident and kernels are picked
+    # (or compiled) for the real shapes at startup
+    logger.info("Warming up YOLO model...")
+    compiled = id(model) in _yolo_compiled_models
+    for batch_size in YOLO_COMPILED_BATCH_SIZES if compiled else YOLO_WARMUP_BATCH_SIZES:
+        dummy_batch = torch.zeros(batch_size, 3, YOLO_INPUT_SIZE, YOLO_INPUT_SIZE)
+        for _ in range(YOLO_WARMUP_PASSES):
+            model.predict(dummy_batch, verbose=False, **_yolo_predict_kwargs)
+    
+    return model
+
 
 def load_yolo_model(model_path: Optional[str] = None):
     """
@@ -180,7 +590,7 @@ def load_yolo_model(model_path: Optional[str] = None):
         # In main.py lifespan startup:
         model = load_yolo_model()
     """
-    global _yolo_model
+    global _yolo_model, _yolo_predict_kwargs
     
     if _yolo_model is not None:
         logger.debug("YOLO model already loaded (singleton)")
@@ -190,7 +600,6 @@ def load_yolo_model(model_path: Optional[str] = None):
     _ensure_collection_directories()
     
     try:
-        from ultralytics import YOLO  # type: ignore
         from ..core.config import get_config
         
         config = get_config()
@@ -204,20 +613,51 @@ def load_yolo_model(model_path: Optional[str] = None):
         if not path.is_absolute():
             path = config.base_dir / model_path
         
+        image_config = config.solver.image
+        
+        # GPU when available; FP16 there unless disabled (CPU stays FP32)
+        device = _yolo_device()
+        half = device != "cpu" and image_config.half_precision
+        
+        # Optional serving export (ONNX Runtime / TensorRT / OpenVINO)
+        export_format = image_config.export_format
+        if export_format == "auto":
+            # TensorRT FP16 on GPU, ONNX Runtime on CPU
+            export_format = "engine" if device != "cpu" else "onnx"
+        if export_format and export_format not in _EXPORT_SUFFIXES:
+            logger.warning(f"Unknown YOLO export_format '{export_format}', using .pt")
+            export_format = ""
+        if export_format == "engine" and device == "cpu":
+            logger.warning("TensorRT export needs a GPU, using .pt")
+            export_format = ""
+        
+        _yolo_predict_kwargs = {"device": device, "half": half}
+        logger.info(f"YOLO device: {device} (half={half})")
+        
         # Load model
         if path.exists():
-            logger.info(f"Loading custom YOLO model from {path}")
-            _yolo_model = YOLO(str(path))
+            _yolo_model = _load_warm_yolo(path, export_format, image_config)
         else:
             logger.warning(f"Custom model not found at {path}, using yolov8m")
-            _yolo_model = YOLO("yolov8m.pt")
+            _yolo_model = _load_warm_yolo(Path("yolov8m.pt"), "", image_config)
         
-        # Warm up the model with a dummy prediction (loads weights into GPU/CPU cache)
-        logger.info("Warming up YOLO model...")
-        dummy_image = Image.new('RGB', (640, 640), color='white')
-        _yolo_model.predict(dummy_image, verbose=False)
+        # Extra tiers stay resident next to the main model
+        for tier, tier_path in image_config.tier_models.items():
+            tier_path = Path(tier_path)
+            if not tier_path.is_absolute():
+                tier_path = config.base_dir / tier_path
+            if not tier_path.exists():
+                logger.warning(f"YOLO {tier} model not found at {tier_path}, using main model")
+                continue
+            try:
+                _yolo_tier_models[tier] = _load_warm_yolo(tier_path, export_format, image_config)
+            except Exception as e:
+                logger.warning(f"Failed to load YOLO {tier} model: {e}")
         
-        logger.info(f"YOLO model loaded successfully: {type(_yolo_model).__name__}")
+        logger.info(
+            f"YOLO model loaded successfully: {type(_yolo_model).__name__}"
+            + (f" (tiers: {', '.join(_yolo_tier_models)})" if _yolo_tier_models else "")
+        )
         return _yolo_model
         
     except Exception as e:
@@ -243,6 +683,16 @@ def get_yolo_model():
     return _yolo_model
 
 
+def get_yolo_model_for(target_class: str):
+    """
+    Get the model tier for a target class (see _TIER_BY_CLASS).
+    
+    Falls back to the main model when that tier isn't loaded.
+    """
+    tier = _TIER_BY_CLASS.get(target_class, YOLO_DEFAULT_TIER)
+    return _yolo_tier_models.get(tier, _yolo_model)
+
+
 async def get_yolo_model_async():
     """
     Get the YOLO model, loading it if necessary (thread-safe).
@@ -263,7 +713,7 @@ async def get_yolo_model_async():
             return _yolo_model
         
         # Run the synchronous load in a thread pool
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         _yolo_model = await loop.run_in_executor(None, load_yolo_model)
         return _yolo_model
 
@@ -315,6 +765,31 @@ CHALLENGE_MAPPING = {
     "a tractor": "tractor",
 }
 
+# One pass over the instruction text. Longest keys first so "bicycles" /
+# "a bicycle" win over "bicycle" at the same position. No \b anchors:
+# text_content() runs the prompt's <strong> into its neighbours
+# ("withcrosswalksclick verify"), so keys are matched as substrings.
+_CHALLENGE_RE = re.compile(
+    "|".join(sorted(map(re.escape, CHALLENGE_MAPPING), key=len, reverse=True))
+)
+
+
+# =============================================================================
+# CHALLENGE DOM LOOKUPS
+# =============================================================================
+# Iframe selector lists and the checkbox script live in utils.recaptcha_dom.
+
+# Pause between tile clicks (seconds). Clicks stay sequential: each one
+# is a real mouse move/down/up, and concurrent clicks would interleave.
+TILE_CLICK_DELAY = (0.05, 0.15)
+
+# Per-tile <img> src (null where a tile has no image), in tile order.
+# img.src is the resolved absolute URL.
+_TILE_SRCS_SCRIPT = '''tiles => tiles.map(tile => {
+    const img = tile.querySelector('img');
+    return img ? img.src : null;
+})'''
+
 
 # =============================================================================
 # IMAGE SOLVER CLASS
@@ -339,15 +814,20 @@ class ImageSolver:
         self.config = get_config()
         self.confidence_threshold = self.config.solver.image.confidence_threshold
         self.max_rounds = self.config.solver.image.max_rounds
+        
+        # Reused across rounds of this solve: dynamic challenges only
+        # replace the clicked tiles, the rest keep their src and bytes
+        self._tile_bytes: Dict[str, bytes] = {}  # src -> image bytes
+        self._tile_detections: Dict[Tuple[int, bytes], Tuple[np.ndarray, np.ndarray]] = {}
     
-    def _get_model(self):
+    def _get_model(self, target_class: Optional[str] = None):
         """
-        Get the YOLO model (singleton).
+        Get the YOLO model (singleton), or its tier for target_class.
         
         This is a ZERO-COST operation - just returns the cached global instance.
         No disk I/O, no initialization overhead.
         """
-        model = get_yolo_model()
+        model = get_yolo_model_for(target_class) if target_class else get_yolo_model()
         if model is None:
             raise RuntimeError(
                 "YOLO model not loaded. Call load_yolo_model() at startup."
@@ -371,8 +851,8 @@ class ImageSolver:
         last_challenge_type = None
         
         try:
-            # Get the singleton model (zero-cost)
-            model = self._get_model()
+            # Fail fast if no model is loaded (zero-cost)
+            self._get_model()
             
             for round_num in range(self.max_rounds):
                 logger.info(f"Image solve round {round_num + 1}/{self.max_rounds}")
@@ -411,8 +891,10 @@ class ImageSolver:
                 # Store for potential failed case collection
                 last_round_tiles = tiles
                 
-                # Classify tiles using the singleton model
-                matching_indices = await self._classify_tiles(tiles, target_class, model)
+                # Classify tiles using the resident model tier for this class
+                matching_indices = await self._classify_tiles(
+                    tiles, target_class, self._get_model(target_class)
+                )
                 logger.info(f"Matching tiles: {matching_indices}")
                 
                 # Click matching tiles
@@ -457,21 +939,11 @@ class ImageSolver:
     
     async def _get_challenge_frame(self, page):
         """Get the challenge iframe content frame"""
-        selectors = [
-            "iframe[src*='recaptcha'][src*='bframe']",
-            "iframe[src*='google.com/recaptcha/api2/bframe']",
-            "iframe[src*='google.com/recaptcha/enterprise/bframe']",
-        ]
-        
-        for selector in selectors:
-            try:
-                iframe = await page.query_selector(selector)
-                if iframe:
-                    frame = await iframe.content_frame()
-                    if frame:
-                        return frame
-            except Exception:
-                continue
+        with suppress(Exception):
+            # One selector list = one lookup instead of one per variant
+            iframe = await page.query_selector(CHALLENGE_IFRAME_SELECTOR)
+            if iframe:
+                return await iframe.content_frame()
         
         return None
     
@@ -483,11 +955,8 @@ class ImageSolver:
                 text = await instruction.text_content()
                 text = text.lower().strip()
                 
-                for key in CHALLENGE_MAPPING.keys():
-                    if key in text:
-                        return key
-                
-                return text
+                match = _CHALLENGE_RE.search(text)
+                return match.group(0) if match else text
             
             return None
         except Exception as e:
@@ -501,37 +970,42 @@ class ImageSolver:
         if challenge_lower in CHALLENGE_MAPPING:
             return CHALLENGE_MAPPING[challenge_lower]
         
-        for key, value in CHALLENGE_MAPPING.items():
-            if key in challenge_lower:
-                return value
-        
-        return None
+        match = _CHALLENGE_RE.search(challenge_lower)
+        return CHALLENGE_MAPPING[match.group(0)] if match else None
     
     async def _get_tile_images(self, frame) -> List[Tuple[int, bytes]]:
-        """Get all tile images from the challenge."""
-        tiles = []
+        """
+        Get all tile images from the challenge.
         
+        All tile srcs come back from one evaluate, then every distinct URL
+        is fetched once, concurrently (grid tiles often share one image URL).
+        Srcs seen in an earlier round come from the tile cache instead.
+        """
         try:
-            tile_elements = await frame.query_selector_all(".rc-imageselect-tile")
+            srcs = await frame.eval_on_selector_all(".rc-imageselect-tile", _TILE_SRCS_SCRIPT)
+            cache = self._tile_bytes
+            
+            urls = list({
+                src for src in srcs
+                if src and src not in cache and not src.startswith("data:")
+            })
+            fetched = await asyncio.gather(*(self._fetch_tile(url) for url in urls))
+            for url, image_bytes in zip(urls, fetched):
+                if image_bytes is not None:
+                    cache[url] = image_bytes
             
-            for i, tile in enumerate(tile_elements):
+            tiles = []
+            for i, src in enumerate(srcs):
+                if not src:
+                    continue
                 try:
-                    img = await tile.query_selector("img")
-                    if img:
-                        src = await img.get_attribute("src")
-                        if src:
-                            if src.startswith("data:"):
-                                data = src.split(",")[1]
-                                image_bytes = base64.b64decode(data)
-                            else:
-                                async with aiohttp.ClientSession() as session:
-                                    async with session.get(src) as response:
-                                        if response.status == 200:
-                                            image_bytes = await response.read()
-                                        else:
-                                            continue
-                            
-                            tiles.append((i, image_bytes))
+                    image_bytes = cache.get(src)
+                    if image_bytes is None:
+                        if not src.startswith("data:"):
+                            continue  # download failed
+                        image_bytes = cache[src] = base64.b64decode(src.split(",")[1])
+                    
+                    tiles.append((i, image_bytes))
                 except Exception as e:
                     logger.debug(f"Error getting tile {i}: {e}")
             
@@ -541,6 +1015,17 @@ class ImageSolver:
             logger.error(f"Error getting tile images: {e}")
             return []
     
+    async def _fetch_tile(self, url: str) -> Optional[bytes]:
+        """Download a tile image through the shared session"""
+        try:
+            session = await get_http_session()
+            async with session.get(url) as response:
+                if response.status == 200:
+                    return await response.read()
+        except Exception as e:
+            logger.debug(f"Error downloading tile {url}: {e}")
+        return None
+    
     async def _classify_tiles(
         self,
         tiles: List[Tuple[int, bytes]],
@@ -552,42 +1037,57 @@ class ImageSolver:
         
         ACTIVE LEARNING: Tiles with uncertain predictions (confidence 0.3-0.6)
         are saved to data/training_collection/{class}/ for later labeling.
+        
+        Detections are cached per (model, tile bytes), so only tiles that are
+        new this round (or new image content) reach the model.
         """
         matching_indices = []
         
+        # Class IDs that count as the target (exact or "fire_hydrant" ~ "fire hydrant")
+        target_ids = _target_class_ids(model, target_class)
+        
+        detections = self._tile_detections
+        model_id = id(model)
+        pending = {}
         for idx, image_bytes in tiles:
+            if (model_id, image_bytes) not in detections:
+                pending.setdefault(image_bytes, idx)
+        
+        if pending:
             try:
-                image = Image.open(io.BytesIO(image_bytes))
-                
-                # Run prediction using the singleton model
-                results = model.predict(
-                    image,
-                    conf=self.confidence_threshold,
-                    verbose=False
+                # Decode + batched prediction (resident model), shared with any
+                # concurrent challenges; runs on the YOLO executor, off the loop.
+                batch_tiles, results = await _get_yolo_batcher(model).submit(
+                    model, [(idx, image_bytes) for image_bytes, idx in pending.items()],
+                    self.confidence_threshold
                 )
-                
-                if results and len(results) > 0:
-                    for detection in results[0].boxes:
-                        class_id = int(detection.cls)
-                        class_name = model.names[class_id]
-                        confidence = float(detection.conf)
-                        
-                        # Active Learning: Save uncertain predictions
-                        if AL_CONFIDENCE_LOW <= confidence <= AL_CONFIDENCE_HIGH:
-                            save_uncertain_tile(image_bytes, target_class, confidence)
-                        
-                        if class_name.lower() == target_class.lower():
-                            logger.debug(f"Tile {idx}: Found {class_name} with conf {confidence:.2f}")
-                            matching_indices.append(idx)
-                            break
-                        
-                        if target_class.replace("_", " ") in class_name.lower():
-                            logger.debug(f"Tile {idx}: Found {class_name} (similar) with conf {confidence:.2f}")
-                            matching_indices.append(idx)
-                            break
-                
             except Exception as e:
-                logger.debug(f"Error classifying tile {idx}: {e}")
+                logger.error(f"Error classifying tiles: {e}")
+                return matching_indices
+            
+            for (idx, image_bytes), result in zip(batch_tiles, results):
+                class_ids = result.boxes.cls.cpu().numpy().astype(np.int64)
+                confidences = result.boxes.conf.cpu().numpy()
+                detections[(model_id, image_bytes)] = (class_ids, confidences)
+                
+                # Active Learning: Save uncertain predictions (boxes up to the first hit)
+                hits = np.flatnonzero(np.isin(class_ids, target_ids))
+                seen = confidences[:hits[0] + 1] if hits.size else confidences
+                uncertain = seen[(seen >= AL_CONFIDENCE_LOW) & (seen <= AL_CONFIDENCE_HIGH)]
+                for confidence in uncertain.tolist():
+                    save_uncertain_tile(image_bytes, target_class, confidence)
+        
+        for idx, image_bytes in tiles:
+            detection = detections.get((model_id, image_bytes))
+            if detection is None:
+                continue  # failed to decode
+            class_ids, confidences = detection
+            
+            hits = np.flatnonzero(np.isin(class_ids, target_ids))
+            if hits.size:
+                first = hits[0]
+                logger.debug(f"Tile {idx}: Found {model.names[int(class_ids[first])]} with conf {confidences[first]:.2f}")
+                matching_indices.append(idx)
         
         return matching_indices
     
@@ -599,7 +1099,7 @@ class ImageSolver:
             for idx in indices:
                 if idx < len(tile_elements):
                     await tile_elements[idx].click()
-                    await frame.wait_for_timeout(200)
+                    await asyncio.sleep(random.uniform(*TILE_CLICK_DELAY))
                     
         except Exception as e:
             logger.error(f"Error clicking tiles: {e}")
@@ -616,29 +1116,9 @@ class ImageSolver:
     async def _check_solved(self, page) -> bool:
         """Check if the captcha was solved"""
         try:
-            iframe_selectors = [
-                "iframe[src*='recaptcha'][src*='anchor']",
-                "iframe[src*='google.com/recaptcha/api2/anchor']",
-            ]
-            
-            for selector in iframe_selectors:
-                try:
-                    iframe = await page.query_selector(selector)
-                    if iframe:
-                        frame = await iframe.content_frame()
-                        if frame:
-                            is_checked = await frame.evaluate('''
-                                () => {
-                                    const anchor = document.querySelector('#recaptcha-anchor');
-                                    return anchor && anchor.classList.contains('recaptcha-checkbox-checked');
-                                }
-                            ''')
-                            if is_checked:
-                                return True
-                except Exception:
-                    continue
-            
-            return False
+            iframe = await page.query_selector(ANCHOR_IFRAME_SELECTOR)
+            frame = await iframe.content_frame() if iframe else None
+            return bool(frame and await frame.evaluate(IS_CHECKED_SCRIPT))
         except Exception:
             return False
     
@@ -2,7 +2,7 @@
 Core module initialization
 """
 
-from .config import Config, get_config, load_config, reload_config
+from .config import Config, get_config, get_price, load_config, reload_config
 from .browser_pool import BrowserPool
 from .task_manager import TaskManager, Task, TaskStatus
 
@@ -10,6 +10,7 @@ __all__ = [
     'Config',
     'get_config', 
     'load_config',
+    'get_price',
     'reload_config',
     'BrowserPool',
     'TaskManager',
@@ -5,8 +5,9 @@ Loads settings from config.yaml and environment variables
 
 import os
 import yaml
+from functools import lru_cache
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Union
 from pathlib import Path
 
 
@@ -16,6 +17,7 @@ class ServerConfig:
     port: int = 8080
     workers: int = 4
     debug: bool = False
+    cors_origins: List[str] = field(default_factory=lambda: ["*"])
 
 
 @dataclass
@@ -30,6 +32,8 @@ class BrowserConfig:
 class AudioConfig:
     engine: str = "whisper"  # whisper | google | azure
     whisper_model: str = "base"
+    whisper_backend: str = "faster"  # faster (CTranslate2 int8) | openai
+    whisper_compile: bool = False  # openai backend: torch.compile the encoder
     max_attempts: int = 5
 
 
@@ -39,6 +43,12 @@ class ImageConfig:
     model_path: str = "models/recaptcha_yolov8m_best.pt"
     confidence_threshold: float = 0.5
     max_rounds: int = 10
+    half_precision: bool = True  # FP16 inference when running on CUDA
+    export_format: str = ""  # "" (.pt) | auto | onnx | engine | openvino
+    export_int8: bool = False  # INT8 export (engine / openvino; needs calibration data)
+    save_pool_size: int = 8  # threads writing active-learning tiles to disk
+    torch_compile: bool = False  # .pt only: fuse + torch.compile at load time
+    tier_models: Dict[str, str] = field(default_factory=dict)  # nano | small | medium -> model path
 
 
 @dataclass
@@ -46,6 +56,7 @@ class SolverConfig:
     primary_method: str = "audio"  # audio | image
     fallback_enabled: bool = True
     max_retries: int = 3
+    share_inflight_solves: bool = False  # identical concurrent solves share one token
     audio: AudioConfig = field(default_factory=AudioConfig)
     image: ImageConfig = field(default_factory=ImageConfig)
 
@@ -63,6 +74,13 @@ class RateLimitConfig:
     concurrent_tasks: int = 50
 
 
+@dataclass
+class CacheConfig:
+    key_ttl: float = 30.0           # API key lookup cache (seconds)
+    key_max_size: int = 10000
+    balance_ttl: float = 1.0        # /getBalance response cache (seconds)
+
+
 @dataclass
 class LoggingConfig:
     level: str = "INFO"
@@ -78,6 +96,7 @@ class Config:
     solver: SolverConfig = field(default_factory=SolverConfig)
     pricing: PricingConfig = field(default_factory=PricingConfig)
     rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
     
     # Paths
@@ -135,6 +154,10 @@ def load_config(config_path: Optional[Union[str, Path]] = None) -> Config:
             if 'rate_limit' in yaml_config:
                 config.rate_limit = RateLimitConfig(**yaml_config['rate_limit'])
             
+            # Cache
+            if 'cache' in yaml_config:
+                config.cache = CacheConfig(**yaml_config['cache'])
+            
             # Logging
             if 'logging' in yaml_config:
                 config.logging = LoggingConfig(**yaml_config['logging'])
@@ -150,6 +173,8 @@ def load_config(config_path: Optional[Union[str, Path]] = None) -> Config:
         config.browser.headless = os.environ['BROWSER_HEADLESS'].lower() == 'true'
     if os.environ.get('YOLO_MODEL_PATH'):
         config.solver.image.model_path = os.environ['YOLO_MODEL_PATH']
+    if os.environ.get('IMG_SAVE_POOL_SIZE'):
+        config.solver.image.save_pool_size = int(os.environ['IMG_SAVE_POOL_SIZE'])
     
     # Ensure directories exist
     config.models_dir.mkdir(parents=True, exist_ok=True)
@@ -171,8 +196,15 @@ def get_config() -> Config:
     return _config
 
 
+@lru_cache(maxsize=32)  # bounded: /solve passes the client's "type" through
+def get_price(captcha_type: str) -> float:
+    """Price per solve for a captcha type (normal | invisible | enterprise)"""
+    return getattr(get_config().pricing, f"{captcha_type}_v2", 0.001)
+
+
 def reload_config(config_path: Optional[str] = None) -> Config:
     """Reload configuration from file"""
     global _config
     _config = load_config(config_path)
+    get_price.cache_clear()
     return _config
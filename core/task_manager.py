@@ -66,6 +66,14 @@ class Task:
     cost: float = 0.0
     ip: Optional[str] = None
     
+    # Set once the task reaches READY/FAILED (long-poll /getTaskResult)
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False, compare=False)
+    
+    @property
+    def is_finished(self) -> bool:
+        """True once the task is READY, FAILED or EXPIRED"""
+        return self.status in (TaskStatus.READY, TaskStatus.FAILED, TaskStatus.EXPIRED)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert task to dictionary"""
         return {
@@ -181,7 +189,7 @@ class TaskManager:
             self._tasks[task_id] = task
             self._total_created += 1
         
-        logger.info(f"Created task {task_id} for {website_url}")
+        logger.info("Created task %s for %s", task_id, website_url)
         return task
     
     def get_task(self, task_id: str) -> Optional[Task]:
@@ -235,6 +243,9 @@ class TaskManager:
                 task.error_message = error_message
                 self._total_failed += 1
             
+            if task.is_finished:
+                task.done.set()
+            
             return task
     
     def delete_task(self, task_id: str) -> bool:
@@ -289,7 +300,7 @@ class TaskManager:
             del self._tasks[task_id]
         
         if expired_ids:
-            logger.info(f"Cleaned up {len(expired_ids)} expired tasks")
+            logger.info("Cleaned up %d expired tasks", len(expired_ids))
     
     def get_stats(self) -> Dict[str, Any]:
         """Get task manager statistics"""
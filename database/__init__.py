@@ -8,12 +8,16 @@ SQLite database with async support via aiosqlite.
 from .db import (
     # Connection management
     get_db,
+    read_connection,
     init_db,
     close_db,
     
     # API Key operations
     get_api_key,
     update_api_key_balance,
+    deduct_api_key_balance,
+    credit_api_key_balance,
+    bulk_deduct_api_key_balances,
     increment_api_key_stats,
     create_api_key_record,
     delete_api_key_record,
@@ -21,6 +25,9 @@ from .db import (
     
     # Usage logging
     log_usage,
+    queue_usage,
+    start_usage_writer,
+    stop_usage_writer,
     get_usage_stats,
     
     # Constants
@@ -34,12 +41,16 @@ get_all_api_keys = list_all_api_keys
 __all__ = [
     # Connection management
     "get_db",
+    "read_connection",
     "init_db",
     "close_db",
     
     # API Key operations
     "get_api_key",
     "update_api_key_balance",
+    "deduct_api_key_balance",
+    "credit_api_key_balance",
+    "bulk_deduct_api_key_balances",
     "increment_api_key_stats",
     "create_api_key_record",
     "delete_api_key_record",
@@ -51,6 +62,9 @@ __all__ = [
     
     # Usage logging
     "log_usage",
+    "queue_usage",
+    "start_usage_writer",
+    "stop_usage_writer",
     "get_usage_stats",
     
     # Constants
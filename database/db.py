@@ -44,21 +44,29 @@ usage_logs:
 import os
 import logging
 import asyncio
-from typing import Optional, Dict, Any, List
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, AsyncIterator
 from pathlib import Path
 from datetime import datetime
 
 import aiosqlite
+import orjson
 
 logger = logging.getLogger(__name__)
 
 # Database file path
 DB_PATH = Path(__file__).parent.parent / "data" / "solver.db"
 
-# Global connection pool (single connection for SQLite)
+# Global writer connection (single connection - SQLite has one writer)
 _db_connection: Optional[aiosqlite.Connection] = None
 _db_lock = asyncio.Lock()
 
+# Read-only connection pool. With WAL, readers don't block the writer
+# (or each other), so hot lookups like get_api_key() don't queue behind
+# balance updates on the single writer connection.
+READ_POOL_SIZE = 4
+_read_pool: Optional[asyncio.Queue] = None
+
 
 # =============================================================================
 # SCHEMA DEFINITIONS
@@ -126,11 +134,36 @@ async def get_db() -> aiosqlite.Connection:
     return _db_connection  # type: ignore
 
 
+@asynccontextmanager
+async def read_connection() -> AsyncIterator[aiosqlite.Connection]:
+    """
+    Borrow a connection from the read pool (falls back to the writer).
+    
+    Usage:
+        async with read_connection() as db:
+            async with db.execute("SELECT ...") as cursor:
+                row = await cursor.fetchone()
+    """
+    if _read_pool is None:
+        db = await get_db()
+        if _read_pool is None:
+            yield db
+            return
+    
+    pool = _read_pool
+    conn = await pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put_nowait(conn)
+
+
 async def init_db(db_path: Optional[Path] = None) -> aiosqlite.Connection:
     """
     Initialize the database connection and create tables.
     
-    This should be called ONCE during server startup (in main.py lifespan).
+    This should be called ONCE during server startup (framework lifespan
+    in api.app). Opens the writer connection and the read pool.
     
     Args:
         db_path: Optional custom path for database file
@@ -138,7 +171,7 @@ async def init_db(db_path: Optional[Path] = None) -> aiosqlite.Connection:
     Returns:
         aiosqlite.Connection instance
     """
-    global _db_connection
+    global _db_connection, _read_pool
     
     path = db_path or DB_PATH
     
@@ -154,6 +187,10 @@ async def init_db(db_path: Optional[Path] = None) -> aiosqlite.Connection:
     # Enable WAL mode for better concurrent read/write performance
     await conn.execute("PRAGMA journal_mode=WAL")
     
+    # WAL is durable across app crashes with synchronous=NORMAL,
+    # and avoids an fsync on every commit
+    await conn.execute("PRAGMA synchronous=NORMAL")
+    
     # Enable foreign keys
     await conn.execute("PRAGMA foreign_keys=ON")
     
@@ -168,13 +205,27 @@ async def init_db(db_path: Optional[Path] = None) -> aiosqlite.Connection:
             logger.info("Seeding default API keys...")
             await _seed_default_keys(conn)
     
-    logger.info("Database initialized successfully")
+    # Open the read pool (after schema exists)
+    pool: asyncio.Queue = asyncio.Queue()
+    for _ in range(READ_POOL_SIZE):
+        reader = await aiosqlite.connect(str(path))
+        await reader.execute("PRAGMA query_only=ON")
+        await reader.execute("PRAGMA busy_timeout=5000")
+        pool.put_nowait(reader)
+    _read_pool = pool
+    
+    logger.info(f"Database initialized successfully ({READ_POOL_SIZE} read connections)")
     return conn
 
 
 async def close_db():
-    """Close the database connection gracefully."""
-    global _db_connection
+    """Close the database connections gracefully."""
+    global _db_connection, _read_pool
+    
+    if _read_pool is not None:
+        pool, _read_pool = _read_pool, None
+        while not pool.empty():
+            await pool.get_nowait().close()
     
     if _db_connection:
         await _db_connection.close()
@@ -216,33 +267,32 @@ async def get_api_key(key: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with key data or None if not found
     """
-    db = await get_db()
-    
-    async with db.execute(
-        """
-        SELECT id, key, balance, is_owner, max_threads, created_at, expires_at,
-               last_used_at, total_requests, total_spent
-        FROM api_keys WHERE key = ?
-        """,
-        (key,)
-    ) as cursor:
-        row = await cursor.fetchone()
-        
-        if row is None:
-            return None
-        
-        return {
-            "id": row[0],
-            "key": row[1],
-            "balance": row[2],
-            "is_owner": bool(row[3]),
-            "max_threads": row[4] or 5,  # Default to 5 if NULL
-            "created_at": row[5],
-            "expires_at": row[6],
-            "last_used_at": row[7],
-            "total_requests": row[8],
-            "total_spent": row[9],
-        }
+    async with read_connection() as db:
+        async with db.execute(
+            """
+            SELECT id, key, balance, is_owner, max_threads, created_at, expires_at,
+                   last_used_at, total_requests, total_spent
+            FROM api_keys WHERE key = ?
+            """,
+            (key,)
+        ) as cursor:
+            row = await cursor.fetchone()
+    
+    if row is None:
+        return None
+    
+    return {
+        "id": row[0],
+        "key": row[1],
+        "balance": row[2],
+        "is_owner": bool(row[3]),
+        "max_threads": row[4] or 5,  # Default to 5 if NULL
+        "created_at": row[5],
+        "expires_at": row[6],
+        "last_used_at": row[7],
+        "total_requests": row[8],
+        "total_spent": row[9],
+    }
 
 
 async def update_api_key_balance(key: str, new_balance: float) -> bool:
@@ -267,6 +317,88 @@ async def update_api_key_balance(key: str, new_balance: float) -> bool:
     return cursor.rowcount > 0
 
 
+async def deduct_api_key_balance(key: str, amount: float) -> Optional[float]:
+    """
+    Atomically deduct from an API key's balance (clamped at 0).
+    
+    Single UPDATE ... RETURNING statement: one round-trip, and no
+    read-modify-write window for concurrent deducts to race in.
+    
+    Args:
+        key: The API key string
+        amount: Amount to deduct
+    
+    Returns:
+        New balance, or None if key not found
+    """
+    db = await get_db()
+    
+    async with db.execute(
+        "UPDATE api_keys SET balance = MAX(0, balance - ?) WHERE key = ? RETURNING balance",
+        (amount, key)
+    ) as cursor:
+        row = await cursor.fetchone()
+    await db.commit()
+    
+    return row[0] if row is not None else None
+
+
+async def credit_api_key_balance(key: str, amount: float) -> Optional[float]:
+    """
+    Atomically add to an API key's balance.
+    
+    Args:
+        key: The API key string
+        amount: Amount to add
+    
+    Returns:
+        New balance, or None if key not found
+    """
+    db = await get_db()
+    
+    async with db.execute(
+        "UPDATE api_keys SET balance = balance + ? WHERE key = ? RETURNING balance",
+        (amount, key)
+    ) as cursor:
+        row = await cursor.fetchone()
+    await db.commit()
+    
+    return row[0] if row is not None else None
+
+
+async def bulk_deduct_api_key_balances(debits: Dict[str, float]) -> Dict[str, float]:
+    """
+    Apply several deducts in one transaction (clamped at 0).
+    
+    Used by the coalesced debit flusher in auth.py: one commit per
+    flush instead of one per solved task.
+    
+    Args:
+        debits: API key -> total amount to deduct
+    
+    Returns:
+        API key -> new balance (unknown keys are omitted)
+    """
+    db = await get_db()
+    new_balances = {}
+    
+    try:
+        for key, amount in debits.items():
+            async with db.execute(
+                "UPDATE api_keys SET balance = MAX(0, balance - ?) WHERE key = ? RETURNING balance",
+                (amount, key)
+            ) as cursor:
+                row = await cursor.fetchone()
+            if row is not None:
+                new_balances[key] = row[0]
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    
+    return new_balances
+
+
 async def increment_api_key_stats(key: str, amount_spent: float):
     """
     Increment usage statistics for an API key.
@@ -351,32 +483,31 @@ async def list_all_api_keys() -> List[Dict[str, Any]]:
     Returns:
         List of all API key records
     """
-    db = await get_db()
+    async with read_connection() as db:
+        async with db.execute(
+            """
+            SELECT id, key, balance, is_owner, created_at, expires_at,
+                   last_used_at, total_requests, total_spent
+            FROM api_keys
+            ORDER BY created_at DESC
+            """
+        ) as cursor:
+            rows = await cursor.fetchall()
     
-    async with db.execute(
-        """
-        SELECT id, key, balance, is_owner, created_at, expires_at,
-               last_used_at, total_requests, total_spent
-        FROM api_keys
-        ORDER BY created_at DESC
-        """
-    ) as cursor:
-        rows = await cursor.fetchall()
-        
-        return [
-            {
-                "id": row[0],
-                "key": row[1],
-                "balance": row[2],
-                "is_owner": bool(row[3]),
-                "created_at": row[4],
-                "expires_at": row[5],
-                "last_used_at": row[6],
-                "total_requests": row[7],
-                "total_spent": row[8],
-            }
-            for row in rows
-        ]
+    return [
+        {
+            "id": row[0],
+            "key": row[1],
+            "balance": row[2],
+            "is_owner": bool(row[3]),
+            "created_at": row[4],
+            "expires_at": row[5],
+            "last_used_at": row[6],
+            "total_requests": row[7],
+            "total_spent": row[8],
+        }
+        for row in rows
+    ]
 
 
 # =============================================================================
@@ -407,7 +538,6 @@ async def log_usage(
     if not key_data:
         return
     
-    import json
     now = datetime.now().isoformat()
     
     await db.execute(
@@ -421,12 +551,137 @@ async def log_usage(
             amount,
             int(success),
             now,
-            json.dumps(metadata) if metadata else None
+            orjson.dumps(metadata).decode() if metadata else None
         )
     )
     await db.commit()
 
 
+# =============================================================================
+# BATCHED USAGE LOGGING (off the request path)
+# =============================================================================
+#
+# Billable requests enqueue usage rows instead of awaiting an INSERT +
+# COMMIT inline. A single writer task drains the queue and inserts up to
+# USAGE_BATCH_SIZE rows per transaction. The api_key_id is resolved by a
+# subselect inside the INSERT, so no extra key lookup is needed.
+
+USAGE_QUEUE_MAX_SIZE = 10_000
+USAGE_BATCH_SIZE = 500
+
+_usage_queue: Optional[asyncio.Queue] = None
+_usage_writer_task: Optional[asyncio.Task] = None
+
+_USAGE_BATCH_SQL = """
+INSERT INTO usage_logs (api_key_id, action, amount, success, timestamp, metadata)
+SELECT id, ?, ?, ?, ?, ? FROM api_keys WHERE key = ?
+"""
+
+
+async def queue_usage(
+    api_key: str,
+    action: str,
+    amount: float = 0.0,
+    success: bool = True,
+    metadata: Optional[Dict] = None
+):
+    """
+    Queue a usage event for the background writer.
+    
+    Same arguments as log_usage(). Falls back to an inline log_usage()
+    when the writer is not running (e.g. scripts outside the server).
+    Drops the event with a warning if the queue is full.
+    """
+    if _usage_queue is None:
+        await log_usage(api_key, action, amount, success, metadata)
+        return
+    
+    try:
+        _usage_queue.put_nowait(
+            (api_key, action, amount, success, datetime.now().isoformat(), metadata)
+        )
+    except asyncio.QueueFull:
+        logger.warning("Usage log queue full, dropping %s event for %s...", action, api_key[:20])
+
+
+async def _write_usage_batch(batch: List[tuple]):
+    """Insert a batch of queued usage events in one transaction."""
+    db = await get_db()
+    await db.executemany(
+        _USAGE_BATCH_SQL,
+        [
+            (
+                action,
+                amount,
+                int(success),
+                timestamp,
+                orjson.dumps(metadata).decode() if metadata else None,
+                api_key,
+            )
+            for api_key, action, amount, success, timestamp, metadata in batch
+        ]
+    )
+    await db.commit()
+
+
+async def _usage_writer():
+    """Drain the usage queue until a None sentinel is received."""
+    assert _usage_queue is not None
+    
+    while True:
+        batch = []
+        stop = False
+        
+        item = await _usage_queue.get()
+        while True:
+            if item is None:
+                stop = True
+                break
+            batch.append(item)
+            if len(batch) >= USAGE_BATCH_SIZE:
+                break
+            try:
+                item = _usage_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+        
+        if batch:
+            try:
+                await _write_usage_batch(batch)
+            except Exception as e:
+                logger.error("Failed to write %d usage log rows: %s", len(batch), e)
+        
+        if stop:
+            return
+
+
+def start_usage_writer():
+    """Start the background usage writer (call once at startup)."""
+    global _usage_queue, _usage_writer_task
+    
+    if _usage_writer_task is not None:
+        return
+    
+    _usage_queue = asyncio.Queue(maxsize=USAGE_QUEUE_MAX_SIZE)
+    _usage_writer_task = asyncio.create_task(_usage_writer())
+    logger.info("Usage log writer started")
+
+
+async def stop_usage_writer():
+    """Flush queued usage events and stop the writer (call before close_db)."""
+    global _usage_queue, _usage_writer_task
+    
+    if _usage_writer_task is None or _usage_queue is None:
+        return
+    
+    await _usage_queue.put(None)
+    await _usage_writer_task
+    
+    _usage_queue = None
+    _usage_writer_task = None
+    logger.info("Usage log writer stopped")
+
+
 async def get_usage_stats(api_key: str, days: int = 30) -> Dict[str, Any]:
     """
     Get usage statistics for an API key.
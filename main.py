@@ -6,7 +6,7 @@ FastAPI server with proper async lifecycle management.
 
 STARTUP SEQUENCE:
 1. Load configuration
-2. Initialize SQLite database (async connection pool)
+2. Initialize SQLite database (framework lifespan in api.app)
 3. Initialize YOLO model (singleton - loaded ONCE)
 4. Initialize Browser Pool (persistent browser processes)
 5. Start accepting requests
@@ -17,7 +17,7 @@ Run with:
     python main.py
     
 Or for production:
-    uvicorn main:app --host 0.0.0.0 --port 8080 --workers 1
+    uvicorn main:app --host 0.0.0.0 --port 8080 --workers 1 --loop uvloop --http httptools
 
 NOTE: Use workers=1 because:
 - Browser pool is process-local (not shared across workers)
@@ -39,7 +39,6 @@ from core.config import get_config, load_config
 from core.browser_pool import get_browser_pool, close_browser_pool
 from challenges.image_solver import load_yolo_model, get_yolo_model
 from challenges.audio_solver import load_whisper_model, get_whisper_model
-from database import init_db, close_db
 from utils.logger import setup_logging
 
 logger = logging.getLogger(__name__)
@@ -60,42 +59,36 @@ async def lifespan(app: FastAPI):
     logger.info("STARTUP: Initializing reCAPTCHA Solver...")
     logger.info("=" * 60)
     
-    # 1. Initialize SQLite database
-    logger.info("[1/4] Initializing SQLite database...")
-    try:
-        await init_db()
-        logger.info("[1/4] Database initialized successfully")
-    except Exception as e:
-        logger.error(f"[1/4] Failed to initialize database: {e}")
-        raise  # Can't operate without database
+    # NOTE: The SQLite database is opened by the framework lifespan in
+    # create_app() before this runs, and closed after it exits.
     
-    # 2. Load Whisper model (singleton - ~10-30 seconds for medium, done ONCE)
-    logger.info("[2/4] Loading Whisper model (this takes ~10-30 seconds)...")
+    # 1. Load Whisper model (singleton - ~10-30 seconds for medium, done ONCE)
+    logger.info("[1/3] Loading Whisper model (this takes ~10-30 seconds)...")
     try:
         whisper_model = load_whisper_model()
-        logger.info(f"[2/4] Whisper model loaded successfully")
+        logger.info(f"[1/3] Whisper model loaded successfully")
     except Exception as e:
-        logger.error(f"[2/4] Failed to load Whisper model: {e}")
+        logger.error(f"[1/3] Failed to load Whisper model: {e}")
         # Continue without model - audio solver will try to load on demand
     
-    # 3. Load YOLO model (singleton - ~2-5 seconds, done ONCE)
-    logger.info("[3/4] Loading YOLO model...")
+    # 2. Load YOLO model (singleton - ~2-5 seconds, done ONCE)
+    logger.info("[2/3] Loading YOLO model...")
     try:
         model = load_yolo_model()
-        logger.info(f"[3/4] YOLO model loaded: {type(model).__name__}")
+        logger.info(f"[2/3] YOLO model loaded: {type(model).__name__}")
     except Exception as e:
-        logger.error(f"[3/4] Failed to load YOLO model: {e}")
+        logger.error(f"[2/3] Failed to load YOLO model: {e}")
         # Continue without model - will fallback to audio solver
     
-    # 4. Initialize Browser Pool (launches persistent browsers)
-    logger.info("[4/4] Initializing browser pool...")
+    # 3. Initialize Browser Pool (launches persistent browsers)
+    logger.info("[3/3] Initializing browser pool...")
     try:
         pool = await get_browser_pool()
         stats = pool.get_stats()
-        logger.info(f"[4/4] Browser pool ready: {stats['browser_count']} browsers, "
+        logger.info(f"[3/3] Browser pool ready: {stats['browser_count']} browsers, "
                    f"max {stats['max_total_capacity']} concurrent contexts")
     except Exception as e:
-        logger.error(f"[4/4] Failed to initialize browser pool: {e}")
+        logger.error(f"[3/3] Failed to initialize browser pool: {e}")
         raise  # Can't operate without browsers
     
     logger.info("=" * 60)
@@ -119,13 +112,6 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error closing browser pool: {e}")
     
-    # Close database connection
-    try:
-        await close_db()
-        logger.info("Database connection closed")
-    except Exception as e:
-        logger.error(f"Error closing database: {e}")
-    
     logger.info("Shutdown complete")
 
 
@@ -150,6 +136,22 @@ def main():
     logger.info(f"Browser pool size: {config.browser.pool_size}")
     logger.info(f"Primary solve method: {config.solver.primary_method}")
     
+    # Event loop: uvloop (libuv) when available, stock asyncio otherwise
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        logger.warning("uvloop not installed, falling back to asyncio event loop")
+        loop = "asyncio"
+    
+    # HTTP parser: httptools (C, llhttp) when available, pure-Python h11 otherwise
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        logger.warning("httptools not installed, falling back to h11 HTTP parser")
+        http = "h11"
+    
     # Run with uvicorn
     uvicorn.run(
         "main:app",
@@ -157,6 +159,8 @@ def main():
         port=config.server.port,
         reload=config.server.debug,
         workers=1,  # Single worker - see note above
+        loop=loop,
+        http=http,
         log_level="info" if not config.server.debug else "debug",
         access_log=True,
     )
@@ -5,9 +5,18 @@ Abstract base class for all reCAPTCHA solvers
 
 import logging
 from abc import ABC, abstractmethod
+from contextlib import suppress
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
+from ..utils.recaptcha_dom import (
+    ANCHOR_IFRAME_SELECTOR,
+    CHECKBOX_IFRAME_SELECTOR,
+    CHALLENGE_IFRAME_SELECTOR,
+    CHALLENGE_POPUP_SELECTOR,
+    IS_CHECKED_SCRIPT,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,22 +80,10 @@ class BaseSolver(ABC):
             True if checkbox was clicked successfully
         """
         try:
-            # Wait for reCAPTCHA iframe
-            iframe_selectors = [
-                "iframe[src*='recaptcha'][src*='anchor']",
-                "iframe[src*='google.com/recaptcha/api2/anchor']",
-                "iframe[src*='google.com/recaptcha/enterprise/anchor']",
-                "iframe[title*='reCAPTCHA']",
-            ]
-            
+            # Wait for reCAPTCHA iframe (any variant)
             iframe = None
-            for selector in iframe_selectors:
-                try:
-                    iframe = await page.wait_for_selector(selector, timeout=10000)
-                    if iframe:
-                        break
-                except Exception:
-                    continue
+            with suppress(Exception):
+                iframe = await page.wait_for_selector(CHECKBOX_IFRAME_SELECTOR, timeout=10000)
             
             if not iframe:
                 self.logger.error("Could not find reCAPTCHA iframe")
@@ -120,33 +117,14 @@ class BaseSolver(ABC):
         """
         try:
             # Check if checkbox is checked (green checkmark)
-            iframe_selectors = [
-                "iframe[src*='recaptcha'][src*='anchor']",
-                "iframe[src*='google.com/recaptcha/api2/anchor']",
-                "iframe[src*='google.com/recaptcha/enterprise/anchor']",
-            ]
-            
-            for selector in iframe_selectors:
-                try:
-                    iframe = await page.query_selector(selector)
-                    if iframe:
-                        frame = await iframe.content_frame()
-                        if frame:
-                            # Check for checked state
-                            is_checked = await frame.evaluate('''
-                                () => {
-                                    const anchor = document.querySelector('#recaptcha-anchor');
-                                    return anchor && anchor.classList.contains('recaptcha-checkbox-checked');
-                                }
-                            ''')
-                            
-                            if is_checked:
-                                # Get the token
-                                token = await self._extract_token(page)
-                                if token:
-                                    return token
-                except Exception:
-                    continue
+            iframe = await page.query_selector(ANCHOR_IFRAME_SELECTOR)
+            frame = await iframe.content_frame() if iframe else None
+            if frame:
+                is_checked = await frame.evaluate(IS_CHECKED_SCRIPT)
+                
+                if is_checked:
+                    # Get the token
+                    return await self._extract_token(page)
             
             return None
             
@@ -225,42 +203,16 @@ class BaseSolver(ABC):
             True if challenge appeared, False otherwise
         """
         try:
-            challenge_selectors = [
-                "iframe[src*='recaptcha'][src*='bframe']",
-                "iframe[src*='google.com/recaptcha/api2/bframe']",
-                "iframe[src*='google.com/recaptcha/enterprise/bframe']",
-                "iframe[title='recaptcha challenge expires in two minutes']",
-            ]
-            
-            for selector in challenge_selectors:
-                try:
-                    challenge = await page.wait_for_selector(selector, timeout=timeout)
-                    if challenge:
-                        return True
-                except Exception:
-                    continue
-            
-            return False
-            
+            challenge = await page.wait_for_selector(CHALLENGE_POPUP_SELECTOR, timeout=timeout)
+            return challenge is not None
         except Exception:
             return False
     
     async def _get_challenge_frame(self, page):
         """Get the challenge iframe content frame"""
-        challenge_selectors = [
-            "iframe[src*='recaptcha'][src*='bframe']",
-            "iframe[src*='google.com/recaptcha/api2/bframe']",
-            "iframe[src*='google.com/recaptcha/enterprise/bframe']",
-        ]
-        
-        for selector in challenge_selectors:
-            try:
-                iframe = await page.query_selector(selector)
-                if iframe:
-                    frame = await iframe.content_frame()
-                    if frame:
-                        return frame
-            except Exception:
-                continue
+        with suppress(Exception):
+            iframe = await page.query_selector(CHALLENGE_IFRAME_SELECTOR)
+            if iframe:
+                return await iframe.content_frame()
         
         return None
@@ -0,0 +1,24 @@
+"""
+Test setup
+
+The modules use package-relative imports (from ..core import ...) next to
+top-level ones (from database import ...), so the repo is importable both
+as the "analysis" package and from its own root.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+if "analysis" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(
+        "analysis", ROOT / "__init__.py", submodule_search_locations=[str(ROOT)]
+    )
+    _package = importlib.util.module_from_spec(_spec)
+    sys.modules["analysis"] = _package
+    _spec.loader.exec_module(_package)
@@ -0,0 +1,54 @@
+"""
+Energy VAD in front of Whisper (challenges.audio_solver)
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from analysis.challenges import audio_solver
+from analysis.challenges.audio_solver import (
+    AudioSolver,
+    VAD_MIN_VOICED_RATIO,
+    WHISPER_SAMPLE_RATE,
+    _voiced_ratio,
+)
+
+
+def _mostly_silent_clip(seconds: float = 10.0, voiced_seconds: float = 0.3) -> np.ndarray:
+    """A short 440 Hz burst followed by digital silence"""
+    samples = np.zeros(int(seconds * WHISPER_SAMPLE_RATE), dtype=np.float32)
+    n_voiced = int(voiced_seconds * WHISPER_SAMPLE_RATE)
+    t = np.arange(n_voiced, dtype=np.float32) / WHISPER_SAMPLE_RATE
+    samples[:n_voiced] = 0.3 * np.sin(2 * np.pi * 440.0 * t)
+    return samples
+
+
+@pytest.fixture
+def solver(monkeypatch):
+    monkeypatch.setattr(audio_solver, "_decode_audio", lambda audio_bytes: _mostly_silent_clip())
+    # No config needed: only the cleaning / transcription path is exercised
+    return AudioSolver.__new__(AudioSolver)
+
+
+def test_voiced_ratio_measured_before_stripping(solver):
+    cleaned, voiced = solver._clean_audio(b"audio")
+    assert voiced < VAD_MIN_VOICED_RATIO
+    # The stripped clip is mostly speech, so it can't be the VAD input
+    assert _voiced_ratio(cleaned) > VAD_MIN_VOICED_RATIO
+
+
+def test_mostly_silent_audio_skips_whisper(solver, monkeypatch):
+    class UnusedModel:
+        def __getattr__(self, name):
+            raise AssertionError("Whisper should not run on a mostly silent clip")
+    
+    monkeypatch.setattr(audio_solver, "get_whisper_model", lambda: UnusedModel())
+    monkeypatch.setattr(audio_solver, "_is_faster_whisper", lambda model: True)
+    monkeypatch.setattr(
+        audio_solver, "_run_whisper",
+        lambda model, samples: pytest.fail("Whisper should not run on a mostly silent clip"),
+    )
+    
+    assert asyncio.run(solver._transcribe_whisper(b"audio")) == ""
@@ -0,0 +1,52 @@
+"""
+API key cache (api.middleware.auth)
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("patchright")  # core -> browser pool
+
+from analysis.api.middleware import auth
+
+
+def _key_row(balance: float) -> dict:
+    return {"key": "key", "balance": balance, "expires_at": None, "is_owner": False}
+
+
+def test_fill_is_cached(monkeypatch):
+    async def get_api_key(api_key):
+        return _key_row(1.0)
+    
+    monkeypatch.setattr(auth, "get_api_key", get_api_key)
+    auth.invalidate_cached_key("key")
+    
+    asyncio.run(auth._cached_get_api_key("key"))
+    assert "key" in auth._KEY_CACHE
+    auth.invalidate_cached_key("key")
+
+
+def test_invalidation_during_read_drops_stale_fill(monkeypatch):
+    """A row read before a debit/top-up invalidation is not written back"""
+    async def run():
+        read_started = asyncio.Event()
+        release_read = asyncio.Event()
+        
+        async def get_api_key(api_key):
+            read_started.set()
+            await release_read.wait()
+            return _key_row(0.001)  # pre-debit row
+        
+        monkeypatch.setattr(auth, "get_api_key", get_api_key)
+        auth.invalidate_cached_key("key")
+        
+        read = asyncio.create_task(auth._cached_get_api_key("key"))
+        await read_started.wait()
+        auth.invalidate_cached_key("key")  # debit flushed while the read is in flight
+        release_read.set()
+        
+        assert (await read)["balance"] == 0.001
+        assert "key" not in auth._KEY_CACHE
+    
+    asyncio.run(run())
@@ -0,0 +1,38 @@
+"""
+Health probes (api.routes.health)
+"""
+
+import warnings
+
+import pytest
+
+pytest.importorskip("patchright")  # core -> browser pool
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from analysis.api.routes import health
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(health.router)
+    return app
+
+
+def test_openapi_has_no_duplicate_operation_ids():
+    """HEAD probes stay out of the schema, so building it does not warn"""
+    app = _app()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        schema = app.openapi()
+    
+    assert set(schema["paths"]["/health"]) == {"get"}
+    assert set(schema["paths"]["/live"]) == {"get"}
+
+
+@pytest.mark.parametrize("path", ["/health", "/live"])
+def test_head_probe(path):
+    client = TestClient(_app())
+    assert client.head(path).status_code == 200
+    assert client.get(path).status_code == 200
@@ -0,0 +1,44 @@
+"""
+/createTask and /solve body decoding (lax, like the Pydantic models)
+"""
+
+import pytest
+
+pytest.importorskip("patchright")  # api.routes.tasks -> solvers -> browser pool
+
+from analysis.api.routes.tasks import _CREATE_TASK_DECODER, _DIRECT_SOLVE_DECODER
+
+
+def _create_task(task_fields: str) -> bytes:
+    return (
+        b'{"clientKey": "key", "task": {"websiteURL": "https://example.com", '
+        b'"websiteKey": "sitekey", ' + task_fields.encode() + b'}}'
+    )
+
+
+def test_create_task_string_port():
+    body = _CREATE_TASK_DECODER.decode(
+        _create_task('"proxy": {"address": "1.2.3.4", "port": "8080"}')
+    )
+    assert body.task.proxy.port == 8080
+
+
+@pytest.mark.parametrize("value", ['"true"', "1", "true"])
+def test_create_task_lax_bool(value):
+    body = _CREATE_TASK_DECODER.decode(_create_task(f'"isInvisible": {value}'))
+    assert body.task.isInvisible is True
+
+
+@pytest.mark.parametrize("value", ['"false"', "0"])
+def test_create_task_lax_bool_false(value):
+    body = _CREATE_TASK_DECODER.decode(_create_task(f'"isInvisible": {value}'))
+    assert body.task.isInvisible is False
+
+
+@pytest.mark.parametrize("value, expected", [('"true"', True), ("1", True), ('"false"', False), ("0", False)])
+def test_direct_solve_lax_bool(value, expected):
+    body = _DIRECT_SOLVE_DECODER.decode(
+        b'{"api_key": "key", "url": "https://example.com", "sitekey": "sitekey", '
+        b'"invisible": ' + value.encode() + b'}'
+    )
+    assert body.invisible is expected
@@ -0,0 +1,92 @@
+"""
+/getTaskResult/stream behind the app's middleware stack
+"""
+
+import asyncio
+import zlib
+
+import orjson
+import pytest
+
+pytest.importorskip("patchright")  # api.routes.tasks -> solvers -> browser pool
+
+from analysis.api.app import create_app
+from analysis.api.routes import tasks
+from analysis.core.task_manager import get_task_manager, TaskStatus
+
+
+def _stream_scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"test"),
+            (b"content-type", b"application/json"),
+            (b"accept-encoding", b"gzip"),
+        ],
+        "client": ("127.0.0.1", 12345),
+        "server": ("test", 80),
+    }
+
+
+def test_first_event_not_held_by_gzip(monkeypatch):
+    """With Accept-Encoding: gzip the first event arrives while the task still runs"""
+    async def valid_key(api_key):
+        return True, None, {}
+    
+    monkeypatch.setattr(tasks, "validate_api_key", valid_key)
+    
+    async def run():
+        app = create_app()
+        manager = get_task_manager()
+        task = manager.create_task(
+            "RecaptchaV2TaskProxyless", "https://example.com", "sitekey", client_key="key"
+        )
+        manager.update_task_status(task.id, TaskStatus.PROCESSING)
+        
+        request_body = orjson.dumps({"clientKey": "key", "taskId": task.id})
+        request_sent = False
+        
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": request_body, "more_body": False}
+            await asyncio.Event().wait()  # client stays connected
+        
+        messages: asyncio.Queue = asyncio.Queue()
+        app_task = asyncio.create_task(
+            app(_stream_scope("/api/v1/getTaskResult/stream"), receive, messages.put)
+        )
+        
+        try:
+            start = await asyncio.wait_for(messages.get(), 5)
+            assert start["type"] == "http.response.start"
+            headers = dict(start["headers"])
+            decoder = (
+                zlib.decompressobj(16 + zlib.MAX_WBITS)
+                if headers.get(b"content-encoding") == b"gzip" else None
+            )
+            
+            received = b""
+            while b"\n\n" not in received:
+                message = await asyncio.wait_for(messages.get(), 5)
+                chunk = message.get("body", b"")
+                received += decoder.decompress(chunk) if decoder else chunk
+            
+            assert not task.is_finished
+            assert received.startswith(b"data: ")
+            assert b'"processing"' in received
+        finally:
+            app_task.cancel()
+            await asyncio.gather(app_task, return_exceptions=True)
+            manager.delete_task(task.id)
+    
+    asyncio.run(run())
@@ -5,5 +5,13 @@ Common utility functions
 
 from .proxy import parse_proxy, validate_proxy
 from .logger import setup_logging, get_logger
+from .http import get_http_session, close_http_session
 
-__all__ = ['parse_proxy', 'validate_proxy', 'setup_logging', 'get_logger']
+__all__ = [
+    'parse_proxy',
+    'validate_proxy',
+    'setup_logging',
+    'get_logger',
+    'get_http_session',
+    'close_http_session',
+]
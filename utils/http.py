@@ -0,0 +1,62 @@
+"""
+Shared HTTP Client
+Single pooled aiohttp session for all outbound requests
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# GLOBAL SINGLETON
+# =============================================================================
+#
+# Creating a ClientSession per download builds a new connector, DNS cache
+# and TLS context every time. One session keeps keep-alive connections
+# pooled across all solves. Opened in the app lifespan, closed on shutdown.
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_lock = asyncio.Lock()
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session, creating it on first use.
+    
+    Pass per-request headers to session.get(url, headers=...) -
+    the session itself carries no default headers. It keeps no cookies
+    either, so nothing set during one solve leaks into another.
+    """
+    global _session
+    
+    if _session is None or _session.closed:
+        async with _session_lock:
+            if _session is None or _session.closed:
+                _session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=100,
+                        limit_per_host=20,
+                        ttl_dns_cache=300,
+                        keepalive_timeout=60,
+                    ),
+                    timeout=aiohttp.ClientTimeout(total=30),
+                    cookie_jar=aiohttp.DummyCookieJar(),
+                )
+                logger.debug("Shared HTTP session created")
+    
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the shared aiohttp session"""
+    global _session
+    
+    if _session is not None:
+        await _session.close()
+        _session = None
+        logger.debug("Shared HTTP session closed")
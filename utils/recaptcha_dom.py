@@ -0,0 +1,39 @@
+"""
+reCAPTCHA DOM Lookups
+Selectors and scripts shared by the solvers and challenge solvers
+"""
+
+# Selector lists are joined (CSS "," = OR) so each lookup or wait is one
+# CDP round trip - and one timeout - instead of one per variant.
+
+# Checkbox iframe (api2 and enterprise)
+ANCHOR_IFRAME_SELECTOR = ", ".join([
+    "iframe[src*='recaptcha'][src*='anchor']",
+    "iframe[src*='google.com/recaptcha/api2/anchor']",
+    "iframe[src*='google.com/recaptcha/enterprise/anchor']",
+])
+
+# Anchor iframe, or any iframe titled reCAPTCHA (before its src is set)
+CHECKBOX_IFRAME_SELECTOR = ", ".join([
+    ANCHOR_IFRAME_SELECTOR,
+    "iframe[title*='reCAPTCHA']",
+])
+
+# Challenge popup iframe (api2 and enterprise)
+CHALLENGE_IFRAME_SELECTOR = ", ".join([
+    "iframe[src*='recaptcha'][src*='bframe']",
+    "iframe[src*='google.com/recaptcha/api2/bframe']",
+    "iframe[src*='google.com/recaptcha/enterprise/bframe']",
+])
+
+# Challenge iframe, also matched by its title while it is opening
+CHALLENGE_POPUP_SELECTOR = ", ".join([
+    CHALLENGE_IFRAME_SELECTOR,
+    "iframe[title='recaptcha challenge expires in two minutes']",
+])
+
+# Evaluated in the anchor frame: is the checkbox ticked?
+IS_CHECKED_SCRIPT = '''() => {
+    const anchor = document.querySelector('#recaptcha-anchor');
+    return !!anchor && anchor.classList.contains('recaptcha-checkbox-checked');
+}'''